@@ -2,7 +2,7 @@
 Comparison Controller - API endpoints for scan comparison and regression detection.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
 from services.comparison_service import ComparisonService
 
 router = APIRouter()
@@ -11,15 +11,12 @@ router = APIRouter()
 @router.get("/{project_id}/history")
 async def get_scan_history(project_id: str, limit: int = 30):
     """Get historical scans for a project."""
-    try:
-        scans = await ComparisonService.get_scan_history(project_id, limit)
-        return {
-            "project_id": project_id,
-            "scans": scans,
-            "count": len(scans)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    scans = await ComparisonService.get_scan_history(project_id, limit)
+    return {
+        "project_id": project_id,
+        "scans": scans,
+        "count": len(scans)
+    }
 
 
 @router.get("/{project_id}/compare")
@@ -35,13 +32,10 @@ async def compare_two_scans(
     - current_scan: ID of the current scan
     - previous_scan: ID of the previous scan to compare against
     """
-    try:
-        comparison = await ComparisonService.compare_scans(
-            project_id, current_scan, previous_scan
-        )
-        return comparison
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    comparison = await ComparisonService.compare_scans(
+        project_id, current_scan, previous_scan
+    )
+    return comparison
 
 
 @router.get("/{project_id}/timeline")
@@ -50,11 +44,8 @@ async def get_quality_timeline(project_id: str, days: int = 90):
     Get code quality timeline over specified days.
     Shows quality score, issues count, etc. over time.
     """
-    try:
-        timeline = await ComparisonService.get_quality_timeline(project_id, days)
-        return timeline
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    timeline = await ComparisonService.get_quality_timeline(project_id, days)
+    return timeline
 
 
 @router.get("/{project_id}/roi")
@@ -65,8 +56,5 @@ async def calculate_roi(project_id: str, days: int = 90):
     Query params:
     - days: Number of days to analyze (default: 90)
     """
-    try:
-        roi = await ComparisonService.calculate_roi(project_id, days)
-        return roi
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    roi = await ComparisonService.calculate_roi(project_id, days)
+    return roi
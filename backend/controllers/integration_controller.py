@@ -3,13 +3,18 @@ Integration Controller
 API endpoints for CI/CD and external integrations
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import List
 from services.integration_service import IntegrationService
+from services.db import get_database
 
 router = APIRouter()
 
+# Shared service instance, created once at import time and backed
+# by the singleton database connection pool
+_integration_service = IntegrationService(get_database())
+
 
 class GitHubIntegration(BaseModel):
     repo_url: str
@@ -35,50 +40,34 @@ class WebhookIntegration(BaseModel):
 @router.post("/integrations/{project_id}/github")
 async def setup_github(project_id: str, config: GitHubIntegration):
     """Setup GitHub Actions integration"""
-    try:
-        service = IntegrationService(None)
-        result = await service.setup_github_integration(
-            project_id, config.repo_url, config.access_token
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _integration_service.setup_github_integration(
+        project_id, config.repo_url, config.access_token
+    )
+    return result
 
 
 @router.post("/integrations/{project_id}/gitlab")
 async def setup_gitlab(project_id: str, config: GitLabIntegration):
     """Setup GitLab CI/CD integration"""
-    try:
-        service = IntegrationService(None)
-        result = await service.setup_gitlab_integration(
-            project_id, config.repo_url, config.access_token
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _integration_service.setup_gitlab_integration(
+        project_id, config.repo_url, config.access_token
+    )
+    return result
 
 
 @router.post("/integrations/{project_id}/jira")
 async def setup_jira(project_id: str, config: JiraIntegration):
     """Setup Jira integration"""
-    try:
-        service = IntegrationService(None)
-        result = await service.setup_jira_integration(
-            project_id, config.jira_url, config.project_key, config.api_token
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _integration_service.setup_jira_integration(
+        project_id, config.jira_url, config.project_key, config.api_token
+    )
+    return result
 
 
 @router.post("/integrations/{project_id}/webhook")
 async def setup_webhook(project_id: str, config: WebhookIntegration):
     """Setup webhook integration"""
-    try:
-        service = IntegrationService(None)
-        result = await service.setup_webhook(
-            project_id, config.webhook_url, config.events
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _integration_service.setup_webhook(
+        project_id, config.webhook_url, config.events
+    )
+    return result
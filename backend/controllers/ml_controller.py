@@ -3,12 +3,17 @@ ML Enhancement Controller
 API endpoints for ML model explainability and enhancements
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Query
 from pydantic import BaseModel
 from services.ml_enhancement_service import MLEnhancementService
+from services.db import get_database
 
 router = APIRouter()
 
+# Shared service instance, created once at import time and backed
+# by the singleton database connection pool
+_ml_service = MLEnhancementService(get_database())
+
 
 class ThresholdUpdate(BaseModel):
     risk_level: str
@@ -22,44 +27,28 @@ async def explain_risk_score(
     risk_score: float = Query(...)
 ):
     """Explain why a file has a specific risk score"""
-    try:
-        service = MLEnhancementService(None)
-        result = await service.explain_risk_score(file_path, risk_score)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _ml_service.explain_risk_score(file_path, risk_score)
+    return result
 
 
 @router.post("/ml/{project_id}/threshold")
 async def set_threshold(project_id: str, request: ThresholdUpdate):
     """Set custom risk threshold"""
-    try:
-        service = MLEnhancementService(None)
-        result = await service.set_custom_threshold(
-            project_id, request.risk_level, request.threshold
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _ml_service.set_custom_threshold(
+        project_id, request.risk_level, request.threshold
+    )
+    return result
 
 
 @router.get("/ml/{project_id}/anomalies")
 async def detect_anomalies(project_id: str):
     """Detect code anomalies"""
-    try:
-        service = MLEnhancementService(None)
-        result = await service.detect_anomalies(project_id)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _ml_service.detect_anomalies(project_id)
+    return result
 
 
 @router.post("/ml/{project_id}/learn")
 async def learn_from_history(project_id: str):
     """Learn patterns from historical data"""
-    try:
-        service = MLEnhancementService(None)
-        result = await service.learn_from_history(project_id)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _ml_service.learn_from_history(project_id)
+    return result
@@ -7,9 +7,14 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from typing import List, Optional
 from services.notification_service import NotificationService
+from services.db import get_database
 
 router = APIRouter()
 
+# Shared service instance, created once at import time and backed
+# by the singleton database connection pool
+_notification_service = NotificationService(get_database())
+
 
 class SubscriptionRequest(BaseModel):
     project_id: str
@@ -25,8 +30,7 @@ class NotificationMarkRequest(BaseModel):
 @router.post("/notifications/subscribe")
 async def subscribe_to_notifications(request: SubscriptionRequest):
     """Subscribe user to project notifications"""
-    notification_service = NotificationService(None)
-    result = await notification_service.subscribe(
+    result = await _notification_service.subscribe(
         request.project_id,
         request.user_id,
         request.channels,
@@ -38,8 +42,7 @@ async def subscribe_to_notifications(request: SubscriptionRequest):
 @router.post("/notifications/unsubscribe")
 async def unsubscribe_from_notifications(project_id: str, user_id: str):
     """Unsubscribe user from project notifications"""
-    notification_service = NotificationService(None)
-    result = await notification_service.unsubscribe(project_id, user_id)
+    result = await _notification_service.unsubscribe(project_id, user_id)
     return result
 
 
@@ -50,8 +53,7 @@ async def get_user_notifications(
     unread_only: bool = Query(False)
 ):
     """Get notifications for a user"""
-    notification_service = NotificationService(None)
-    notifications = await notification_service.get_notifications(
+    notifications = await _notification_service.get_notifications(
         user_id, project_id, unread_only
     )
     return {"notifications": notifications}
@@ -60,8 +62,7 @@ async def get_user_notifications(
 @router.post("/notifications/mark-read")
 async def mark_notification_read(request: NotificationMarkRequest):
     """Mark notification as read"""
-    notification_service = NotificationService(None)
-    result = await notification_service.mark_as_read(request.notification_id)
+    result = await _notification_service.mark_as_read(request.notification_id)
     return result
 
 
@@ -72,15 +73,13 @@ async def test_notification(
     channel: str = Query("in_app")
 ):
     """Send a test notification"""
-    notification_service = NotificationService(None)
-    
     # Subscribe user first
-    await notification_service.subscribe(
+    await _notification_service.subscribe(
         project_id, user_id, [channel], ["scan_complete"]
     )
     
     # Send test notification
-    result = await notification_service.notify(
+    result = await _notification_service.notify(
         project_id=project_id,
         notification_type="scan_complete",
         data={"message": "This is a test notification", "test": True},
@@ -3,13 +3,18 @@ Performance Controller
 API endpoints for performance optimization features
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import List
 from services.performance_service import PerformanceService
+from services.db import get_database
 
 router = APIRouter()
 
+# Shared service instance, created once at import time and backed
+# by the singleton database connection pool
+_performance_service = PerformanceService(get_database())
+
 
 class IncrementalScanRequest(BaseModel):
     files: List[str]
@@ -18,42 +23,26 @@ class IncrementalScanRequest(BaseModel):
 @router.post("/performance/{project_id}/incremental-scan")
 async def incremental_scan(project_id: str, request: IncrementalScanRequest):
     """Perform incremental scan on changed files only"""
-    try:
-        service = PerformanceService(None)
-        result = await service.incremental_scan(project_id, request.files)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _performance_service.incremental_scan(project_id, request.files)
+    return result
 
 
 @router.get("/performance/{project_id}/metrics-cached")
 async def get_cached_metrics(project_id: str):
     """Get metrics with caching"""
-    try:
-        service = PerformanceService(None)
-        result = await service.get_metrics_cached(project_id)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _performance_service.get_metrics_cached(project_id)
+    return result
 
 
 @router.post("/performance/{project_id}/invalidate-cache")
 async def invalidate_cache(project_id: str):
     """Invalidate cache for project"""
-    try:
-        service = PerformanceService(None)
-        await service.invalidate_cache(project_id)
-        return {"status": "cache_invalidated"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    await _performance_service.invalidate_cache(project_id)
+    return {"status": "cache_invalidated"}
 
 
 @router.post("/performance/batch-scan")
 async def batch_scan(project_ids: List[str]):
     """Scan multiple projects in batch"""
-    try:
-        service = PerformanceService(None)
-        result = await service.batch_scan_projects(project_ids)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _performance_service.batch_scan_projects(project_ids)
+    return result
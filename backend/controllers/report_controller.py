@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Response
+from io import BytesIO
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from services.report_service import ReportService
 
@@ -12,5 +15,10 @@ class ReportRequest(BaseModel):
 @router.post("/export")
 async def export_report(req: ReportRequest):
     pdf_bytes = await ReportService.generate_pdf(req.project_id, req.sections or [])
-    headers = {"Content-Disposition": f"attachment; filename=\"codesensex_{req.project_id}.pdf\""}
-    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
+    headers = {
+        "Content-Disposition": f"attachment; filename=\"codesensex_{req.project_id}.pdf\"",
+        "Content-Length": str(len(pdf_bytes)),
+    }
+    # Stream the report in chunks instead of handing the whole payload to a
+    # single Response body, so large reports start downloading immediately.
+    return StreamingResponse(BytesIO(pdf_bytes), media_type="application/pdf", headers=headers)
@@ -7,9 +7,14 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from typing import List, Optional, Dict
 from services.search_service import SearchService
+from services.db import get_database
 
 router = APIRouter()
 
+# Shared service instance, created once at import time and backed
+# by the singleton database connection pool
+_search_service = SearchService(get_database())
+
 
 class FilterConditions(BaseModel):
     severity: Optional[List[str]] = None
@@ -41,23 +46,18 @@ async def search_files(project_id: str, request: SearchRequest):
     Query can be: file name, code pattern, issue type, etc.
     Filters: severity, risk score, complexity, duplication, file types, dates
     """
-    try:
-        search_service = SearchService(None)
-        
-        filters_dict = request.filters.dict(exclude_none=True) if request.filters else None
-        
-        results = await search_service.search_files(
-            project_id, request.query, filters_dict
-        )
-        
-        return {
-            "project_id": project_id,
-            "query": request.query,
-            "results_count": len(results),
-            "results": results
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    filters_dict = request.filters.model_dump(exclude_none=True) if request.filters else None
+    
+    results = await _search_service.search_files(
+        project_id, request.query, filters_dict
+    )
+    
+    return {
+        "project_id": project_id,
+        "query": request.query,
+        "results_count": len(results),
+        "results": results
+    }
 
 
 @router.get("/search/{project_id}/quick")
@@ -68,59 +68,42 @@ async def quick_search(
     min_risk: Optional[float] = Query(None, description="Minimum risk score")
 ):
     """Quick search with minimal filters"""
-    try:
-        search_service = SearchService(None)
-        
-        filters = {}
-        if severity:
-            filters['severity'] = [severity]
-        if min_risk:
-            filters['min_risk_score'] = min_risk
-        
-        results = await search_service.search_files(project_id, q, filters if filters else None)
-        
-        return {
-            "query": q,
-            "results_count": len(results),
-            "results": results[:50]  # Limit to 50 results
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    filters = {}
+    if severity:
+        filters['severity'] = [severity]
+    if min_risk:
+        filters['min_risk_score'] = min_risk
+    
+    results = await _search_service.search_files(project_id, q, filters if filters else None)
+    
+    return {
+        "query": q,
+        "results_count": len(results),
+        "results": results[:50]  # Limit to 50 results
+    }
 
 
 @router.post("/search/filters/save")
 async def save_search_filter(user_id: str, request: SaveFilterRequest):
     """Save a custom search filter"""
-    try:
-        search_service = SearchService(None)
-        result = await search_service.save_filter(
-            user_id, request.filter_name, request.conditions
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _search_service.save_filter(
+        user_id, request.filter_name, request.conditions
+    )
+    return result
 
 
 @router.get("/search/filters/{user_id}")
 async def get_saved_filters(user_id: str):
     """Get all saved filters for a user"""
-    try:
-        search_service = SearchService(None)
-        filters = await search_service.get_saved_filters(user_id)
-        return {"filters": filters}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    filters = await _search_service.get_saved_filters(user_id)
+    return {"filters": filters}
 
 
 @router.delete("/search/filters/{user_id}/{filter_name}")
 async def delete_search_filter(user_id: str, filter_name: str):
     """Delete a saved filter"""
-    try:
-        search_service = SearchService(None)
-        result = await search_service.delete_filter(user_id, filter_name)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await _search_service.delete_filter(user_id, filter_name)
+    return result
 
 
 @router.post("/search/{project_id}/apply-filter")
@@ -132,8 +115,7 @@ async def apply_saved_filter(
 ):
     """Apply a saved filter to search"""
     try:
-        search_service = SearchService(None)
-        results = await search_service.apply_saved_filter(
+        results = await _search_service.apply_saved_filter(
             project_id, user_id, filter_name, query
         )
         return {
@@ -144,8 +126,6 @@ async def apply_saved_filter(
         }
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/search/{project_id}/pattern")
@@ -156,8 +136,7 @@ async def pattern_search(
 ):
     """Search for code patterns using regex"""
     try:
-        search_service = SearchService(None)
-        results = await search_service.advanced_pattern_search(
+        results = await _search_service.advanced_pattern_search(
             project_id, pattern, regex
         )
         return {
@@ -168,18 +147,12 @@ async def pattern_search(
         }
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/search/{project_id}/compare")
 async def compare_files(project_id: str, file_paths: List[str]):
     """Compare multiple files side by side"""
-    try:
-        search_service = SearchService(None)
-        comparison = await search_service.multi_file_comparison_search(
-            project_id, file_paths
-        )
-        return comparison
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    comparison = await _search_service.multi_file_comparison_search(
+        project_id, file_paths
+    )
+    return comparison
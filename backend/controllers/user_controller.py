@@ -3,13 +3,39 @@ User Management Controller
 API endpoints for authentication and team management
 """
 
-from fastapi import APIRouter, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, EmailStr
 from typing import Optional, List
 from services.user_service import UserService
+from services.db import get_database
 
 router = APIRouter()
 
+# Shared service instance, created once at import time and backed
+# by the singleton database connection pool
+_user_service = UserService(get_database())
+
+# auto_error=False so we control the status code (401 rather than 403)
+_bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def get_bearer_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer_scheme)
+) -> str:
+    """Extract the bearer token from the Authorization header."""
+    if credentials is None:
+        raise HTTPException(status_code=401, detail="Authorization required")
+    return credentials.credentials
+
+
+async def get_current_session(token: str = Depends(get_bearer_token)) -> dict:
+    """Resolve and validate the session for the supplied bearer token."""
+    session = await _user_service.validate_session(token)
+    if not session:
+        raise HTTPException(status_code=401, detail="Invalid or expired session")
+    return session
+
 
 class UserRegistration(BaseModel):
     email: EmailStr
@@ -47,8 +73,7 @@ class PreferencesUpdate(BaseModel):
 async def register(user: UserRegistration):
     """Register a new user"""
     try:
-        user_service = UserService(None)
-        result = await user_service.create_user(
+        result = await _user_service.create_user(
             user.email, user.password, user.name, user.organization
         )
         return result
@@ -60,154 +85,86 @@ async def register(user: UserRegistration):
 async def login(credentials: UserLogin):
     """Authenticate user"""
     try:
-        user_service = UserService(None)
-        result = await user_service.authenticate(credentials.email, credentials.password)
-        
+        result = await _user_service.authenticate(credentials.email, credentials.password)
+
         if not result:
             raise HTTPException(status_code=401, detail="Invalid credentials")
-        
+
         return result
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
 
 @router.post("/auth/logout")
-async def logout(authorization: str = Header(None)):
+async def logout(token: str = Depends(get_bearer_token)):
     """Logout user"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Invalid authorization header")
-    
-    token = authorization.split(" ")[1]
-    user_service = UserService(None)
-    result = await user_service.logout(token)
+    result = await _user_service.logout(token)
     return result
 
 
 @router.get("/auth/validate")
-async def validate_session(authorization: str = Header(None)):
+async def validate_session(session: dict = Depends(get_current_session)):
     """Validate session token"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Invalid authorization header")
-    
-    token = authorization.split(" ")[1]
-    user_service = UserService(None)
-    session = await user_service.validate_session(token)
-    
-    if not session:
-        raise HTTPException(status_code=401, detail="Invalid or expired session")
-    
     return {"valid": True, "user_id": session["user_id"]}
 
 
 @router.post("/teams")
-async def create_team(team: TeamCreate, authorization: str = Header(None)):
+async def create_team(team: TeamCreate, session: dict = Depends(get_current_session)):
     """Create a new team"""
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Authorization required")
-    
-    token = authorization.split(" ")[1]
-    user_service = UserService(None)
-    session = await user_service.validate_session(token)
-    
-    if not session:
-        raise HTTPException(status_code=401, detail="Invalid session")
-    
-    result = await user_service.create_team(team.name, session["user_id"], team.description)
+    result = await _user_service.create_team(team.name, session["user_id"], team.description)
     return result
 
 
 @router.post("/teams/{team_id}/members")
-async def add_team_member(team_id: str, member: TeamMemberAdd, authorization: str = Header(None)):
+async def add_team_member(team_id: str, member: TeamMemberAdd,
+                          token: str = Depends(get_bearer_token)):
     """Add member to team"""
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Authorization required")
-    
-    user_service = UserService(None)
-    result = await user_service.add_team_member(team_id, member.user_id, member.role)
+    result = await _user_service.add_team_member(team_id, member.user_id, member.role)
     return result
 
 
 @router.delete("/teams/{team_id}/members/{user_id}")
-async def remove_team_member(team_id: str, user_id: str, authorization: str = Header(None)):
+async def remove_team_member(team_id: str, user_id: str,
+                             token: str = Depends(get_bearer_token)):
     """Remove member from team"""
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Authorization required")
-    
-    user_service = UserService(None)
-    result = await user_service.remove_team_member(team_id, user_id)
+    result = await _user_service.remove_team_member(team_id, user_id)
     return result
 
 
 @router.get("/teams/{team_id}/members")
-async def get_team_members(team_id: str, authorization: str = Header(None)):
+async def get_team_members(team_id: str, token: str = Depends(get_bearer_token)):
     """Get all team members"""
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Authorization required")
-    
-    user_service = UserService(None)
-    members = await user_service.get_team_members(team_id)
+    members = await _user_service.get_team_members(team_id)
     return {"members": members}
 
 
 @router.post("/projects/share")
-async def share_project(share: ProjectShare, authorization: str = Header(None)):
+async def share_project(share: ProjectShare, session: dict = Depends(get_current_session)):
     """Share project with another user"""
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Authorization required")
-    
-    token = authorization.split(" ")[1]
-    user_service = UserService(None)
-    session = await user_service.validate_session(token)
-    
-    if not session:
-        raise HTTPException(status_code=401, detail="Invalid session")
-    
-    result = await user_service.share_project(
+    result = await _user_service.share_project(
         share.project_id, session["user_id"], share.shared_with, share.role
     )
     return result
 
 
 @router.delete("/projects/{project_id}/access/{user_id}")
-async def revoke_access(project_id: str, user_id: str, authorization: str = Header(None)):
+async def revoke_access(project_id: str, user_id: str,
+                        token: str = Depends(get_bearer_token)):
     """Revoke project access"""
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Authorization required")
-    
-    user_service = UserService(None)
-    result = await user_service.revoke_project_access(project_id, user_id)
+    result = await _user_service.revoke_project_access(project_id, user_id)
     return result
 
 
 @router.get("/users/projects")
-async def get_user_projects(authorization: str = Header(None)):
+async def get_user_projects(session: dict = Depends(get_current_session)):
     """Get all projects accessible to user"""
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Authorization required")
-    
-    token = authorization.split(" ")[1]
-    user_service = UserService(None)
-    session = await user_service.validate_session(token)
-    
-    if not session:
-        raise HTTPException(status_code=401, detail="Invalid session")
-    
-    projects = await user_service.get_user_projects(session["user_id"])
+    projects = await _user_service.get_user_projects(session["user_id"])
     return {"projects": projects}
 
 
 @router.put("/users/preferences")
-async def update_preferences(prefs: PreferencesUpdate, authorization: str = Header(None)):
+async def update_preferences(prefs: PreferencesUpdate,
+                             session: dict = Depends(get_current_session)):
     """Update user preferences"""
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Authorization required")
-    
-    token = authorization.split(" ")[1]
-    user_service = UserService(None)
-    session = await user_service.validate_session(token)
-    
-    if not session:
-        raise HTTPException(status_code=401, detail="Invalid session")
-    
-    result = await user_service.update_user_preferences(session["user_id"], prefs.preferences)
+    result = await _user_service.update_user_preferences(session["user_id"], prefs.preferences)
     return result
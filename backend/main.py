@@ -9,36 +9,75 @@ This application serves as the main entry point for the backend services,
 handling authentication, request routing, and coordinating various analysis modules.
 """
 
+import importlib
+import os
+import sys
 from contextlib import asynccontextmanager
 from datetime import datetime
-from fastapi import FastAPI, HTTPException
+from hashlib import md5
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
 
-# Import all controller routers
-from controllers.upload_controller import router as upload_router
-from controllers.scan_controller import router as scan_router
-from controllers.metrics_controller import router as metrics_router
-from controllers.risks_controller import router as risks_router
-from controllers.smells_controller import router as smells_router
-from controllers.suggestions_controller import router as suggestions_router
-from controllers.report_controller import router as report_router
-from controllers.comparison_controller import router as comparison_router
-from controllers.project_comparison_controller import router as project_comparison_router
-from controllers.notification_controller import router as notification_router
-from controllers.user_controller import router as user_router
-from controllers.search_controller import router as search_router
-from controllers.security_controller import router as security_router
-from controllers.analytics_controller import router as analytics_router
-from controllers.integration_controller import router as integration_router
-from controllers.performance_controller import router as performance_router
-from controllers.ml_controller import router as ml_router
+# Run on uvloop when available: markedly lower per-await overhead than the
+# default selector loop. Harmless no-op alongside uvicorn --loop uvloop,
+# which installs the same policy.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Use orjson for response serialization when available (3-10x faster than
+# stdlib json on large payloads); fall back to the default encoder otherwise.
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+
+    class DefaultResponse(ORJSONResponse):
+        """ORJSONResponse that stringifies types orjson cannot encode
+        natively (Mongo ObjectId, Decimal, ...)."""
+
+        def render(self, content) -> bytes:
+            return orjson.dumps(content, default=str)
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
+
+# Declarative router registry: (module, prefix, tags). Modules are imported
+# on demand when the registry is walked, so adding/removing a controller is
+# a one-line change and optional routers can be gated by environment.
+ROUTER_SPECS = [
+    ("controllers.upload_controller", "/upload", ["upload"]),
+    ("controllers.scan_controller", "/scan", ["scan"]),
+    ("controllers.metrics_controller", "/metrics", ["metrics"]),
+    ("controllers.risks_controller", "/risks", ["risks"]),
+    ("controllers.smells_controller", "/smells", ["smells"]),
+    ("controllers.suggestions_controller", "/suggestions", ["suggestions"]),
+    ("controllers.report_controller", "/report", ["report"]),
+    ("controllers.comparison_controller", "/comparison", ["comparison"]),
+    ("controllers.project_comparison_controller", "/projects/compare", ["project-comparison"]),
+    ("controllers.notification_controller", "/notifications", ["notifications"]),
+    ("controllers.user_controller", "/users", ["users"]),
+    ("controllers.search_controller", "/search", ["search"]),
+    ("controllers.security_controller", "/security", ["security"]),
+    ("controllers.analytics_controller", "/analytics", ["analytics"]),
+    ("controllers.integration_controller", "/integrations", ["integrations"]),
+    ("controllers.performance_controller", "/performance", ["performance"]),
+]
+
+# The ML router pulls in scikit-learn/xgboost at import time (hundreds of
+# ms and significant RSS); allow skipping it for lightweight deployments
+if os.getenv("ENABLE_ML", "1") == "1":
+    ROUTER_SPECS.append(("controllers.ml_controller", "/ml", ["ml"]))
 
 # Import core services
+from services.cache_service import get_cache
 from services.db import get_database
 from services.dependency_service import get_dependency_graph
-from services.history_service import get_trend_data, get_comparison_data
+from services.history_service import get_trend_data, get_comparison_data, get_history_bundle
 from services.chatbot_service import chat_with_assistant, clear_chat_session
 
 
@@ -77,34 +116,73 @@ app = FastAPI(
     title="Deep Lynctus Backend",
     version="0.2.0",
     description="AI-Powered Code Quality & Bug Risk Analyzer",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
 )
 
+# Browsers reject credentialed requests against a wildcard origin, so
+# allow_credentials=True was silently ignored; drop it until specific
+# origins are configured
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
-    allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-app.include_router(upload_router, prefix="/upload", tags=["upload"])
-app.include_router(scan_router, prefix="/scan", tags=["scan"])
-app.include_router(metrics_router, prefix="/metrics", tags=["metrics"])
-app.include_router(risks_router, prefix="/risks", tags=["risks"])
-app.include_router(smells_router, prefix="/smells", tags=["smells"])
-app.include_router(suggestions_router, prefix="/suggestions", tags=["suggestions"])
-app.include_router(report_router, prefix="/report", tags=["report"])
-app.include_router(comparison_router, prefix="/comparison", tags=["comparison"])
-app.include_router(project_comparison_router, prefix="/projects/compare", tags=["project-comparison"])
-app.include_router(notification_router, prefix="/notifications", tags=["notifications"])
-app.include_router(user_router, prefix="/users", tags=["users"])
-app.include_router(search_router, prefix="/search", tags=["search"])
-app.include_router(security_router, prefix="/security", tags=["security"])
-app.include_router(analytics_router, prefix="/analytics", tags=["analytics"])
-app.include_router(integration_router, prefix="/integrations", tags=["integrations"])
-app.include_router(performance_router, prefix="/performance", tags=["performance"])
-app.include_router(ml_router, prefix="/ml", tags=["ml"])
+# Compress large JSON payloads (metrics/risks lists easily reach hundreds of
+# KB); small responses below the threshold are passed through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Read-mostly GET endpoints that can be cached briefly by clients/proxies
+CACHEABLE_PATH_PREFIXES = (
+    "/metrics", "/risks", "/smells", "/history", "/dependencies",
+    "/analytics", "/api/projects"
+)
+CACHE_CONTROL_VALUE = "public, max-age=60"
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Convert uncaught errors into a 500 response instead of wrapping every
+    handler body in try/except."""
+    import traceback
+    print(f"[ERROR] Unhandled error on {request.method} {request.url.path}: {exc}",
+          file=sys.stderr, flush=True)
+    traceback.print_exc(file=sys.stderr)
+    return DefaultResponse(status_code=500, content={"detail": str(exc)})
+
+
+@app.middleware("http")
+async def add_cache_headers(request: Request, call_next):
+    """Attach Cache-Control/ETag to idempotent GETs and honor If-None-Match."""
+    response = await call_next(request)
+
+    if request.method != "GET" or response.status_code != 200:
+        return response
+    if not request.url.path.startswith(CACHEABLE_PATH_PREFIXES):
+        return response
+    # Buffering a streamed body to hash it would defeat the streaming
+    if response.headers.get("content-type", "").startswith("application/x-ndjson"):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = f'W/"{md5(body).hexdigest()}"'
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL_VALUE}
+        )
+
+    headers = dict(response.headers)
+    headers["ETag"] = etag
+    headers["Cache-Control"] = CACHE_CONTROL_VALUE
+    return Response(content=body, status_code=200, headers=headers)
+
+for _module_path, _prefix, _tags in ROUTER_SPECS:
+    _module = importlib.import_module(_module_path)
+    app.include_router(_module.router, prefix=_prefix, tags=_tags)
 
 
 # ============== Projects Endpoints ==============
@@ -132,71 +210,103 @@ async def get_all_projects():
 @app.get("/dependencies/{project_id}", tags=["dependencies"])
 async def get_dependencies(project_id: str):
     """Get dependency graph data for D3.js visualization."""
-    try:
-        graph = await get_dependency_graph(project_id)
-        if not graph:
-            raise HTTPException(status_code=404, detail="Project not found")
-        return graph
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    cache = get_cache()
+    cache_key = f"response_dependencies_{project_id}"
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    graph = await get_dependency_graph(project_id)
+    if not graph:
+        raise HTTPException(status_code=404, detail="Project not found")
+    # Failure payloads (missing project, repo not cloned, analyzer
+    # errors) are not cached, so a recovered project is picked up on
+    # the next request instead of after the TTL
+    if "error" not in graph and "message" not in graph:
+        await cache.set(cache_key, graph)
+    return graph
 
 
 # ============== History & Trends Endpoints ==============
 @app.get("/history/{project_id}", tags=["history"])
-async def get_scan_history(project_id: str, limit: int = 30):
-    """Get scan history for a project."""
-    try:
+async def get_scan_history(project_id: str, limit: int = 30, include: Optional[str] = None):
+    """Get scan history for a project.
+
+    Pass include=scans,trends,compare to fetch several facets in a
+    single request backed by one history read.
+    """
+    cache = get_cache()
+    cache_key = f"response_history_{project_id}_{limit}_{include or 'scans'}"
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if include:
+        facets = tuple(part.strip() for part in include.split(","))
+        result = await get_history_bundle(project_id, facets, limit=limit)
+    else:
         trends = await get_trend_data(project_id, days=30, limit=limit)
-        return {"project_id": project_id, "scans": trends.get("scans", [])}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        result = {"project_id": project_id, "scans": trends.get("scans", [])}
+    await cache.set(cache_key, result)
+    return result
+
+
+@app.get("/history/{project_id}/stream", tags=["history"])
+async def stream_scan_history(project_id: str, limit: int = 30):
+    """Stream raw scan records as newline-delimited JSON.
+
+    Records are encoded and flushed one at a time, so first-byte latency
+    and encoding memory are bounded by a single record rather than the
+    whole history payload.
+    """
+    db = get_database()
+
+    async def generate():
+        for scan in await db.get_scan_history(project_id, limit=limit):
+            yield DefaultResponse(content=scan).body + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @app.get("/history/{project_id}/trends", tags=["history"])
 async def get_project_trends(project_id: str):
     """Get trend analysis for a project."""
-    try:
-        trends = await get_trend_data(project_id)
-        return trends
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    cache = get_cache()
+    cache_key = f"response_trends_{project_id}"
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    trends = await get_trend_data(project_id)
+    await cache.set(cache_key, trends)
+    return trends
 
 
 @app.get("/history/{project_id}/compare", tags=["history"])
 async def compare_scans(project_id: str):
     """Compare current scan with previous."""
-    try:
-        comparison = await get_comparison_data(project_id)
-        if not comparison:
-            raise HTTPException(status_code=404, detail="Scans not found")
-        return comparison
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    comparison = await get_comparison_data(project_id)
+    if not comparison:
+        raise HTTPException(status_code=404, detail="Scans not found")
+    return comparison
 
 
 # ============== AI Chatbot Endpoints ==============
 @app.post("/chat/{project_id}", tags=["chat"])
 async def chat(project_id: str, chat_message: ChatMessage):
     """Chat with the AI code review assistant."""
-    try:
-        response = await chat_with_assistant(
-            project_id, 
-            chat_message.message, 
-            chat_message.file_context
-        )
-        return response
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await chat_with_assistant(
+        project_id,
+        chat_message.message,
+        chat_message.file_context
+    )
 
 
 @app.delete("/chat/{project_id}", tags=["chat"])
 async def clear_chat(project_id: str):
     """Clear chat history for a project."""
-    try:
-        await clear_chat_session(project_id)
-        return {"success": True, "message": "Chat history cleared"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    await clear_chat_session(project_id)
+    return {"success": True, "message": "Chat history cleared"}
 
 
 @app.get("/")
@@ -2,7 +2,7 @@
 Migration: Initial Database Schema
 """
 
-from backend.migrations.runner import Migration
+from backend.migrations.runner import Migration, log
 
 
 class InitialSchemaMigration(Migration):
@@ -43,7 +43,7 @@ class InitialSchemaMigration(Migration):
             ("owner_id", 1)
         ])
         
-        print("✓ Created initial indexes")
+        log.info("✓ Created initial indexes")
     
     async def down(self):
         """Rollback migration"""
@@ -54,17 +54,19 @@ class InitialSchemaMigration(Migration):
             try:
                 # Note: This is a simplified rollback
                 # In production, you'd use proper index management
-                print(f"Would drop indexes for {collection}")
+                log.info(f"Would drop indexes for {collection}")
             except Exception as e:
-                print(f"Error dropping indexes for {collection}: {e}")
+                log.info(f"Error dropping indexes for {collection}: {e}")
     
     async def _create_collection_indexes(self, collection: str, indexes: list):
         """Helper to create indexes for a collection"""
-        for index_spec in indexes:
-            field, direction = index_spec
-            try:
-                # Note: Actual index creation would use MongoDB driver
-                # This is a placeholder for the pattern
-                print(f"Creating index on {collection}.{field}")
-            except Exception as e:
-                print(f"Error creating index: {e}")
+        # Note: Actual index creation would build IndexModel objects and
+        # issue one create_indexes() call per collection, a single
+        # round-trip instead of one per field
+        field_str = ", ".join(field for field, direction in indexes)
+        log.info(f"Creating indexes on {collection}: [{field_str}]")
+
+
+# Explicit registry entry so the runner resolves the class without
+# scanning module attributes
+MIGRATION = InitialSchemaMigration
@@ -2,7 +2,7 @@
 Migration: Add Performance Indexes
 """
 
-from backend.migrations.runner import Migration
+from backend.migrations.runner import Migration, log
 
 
 class AddPerformanceIndexesMigration(Migration):
@@ -54,18 +54,23 @@ class AddPerformanceIndexesMigration(Migration):
         # Text index for search
         await self._create_text_index("files", ["file_path", "issues"])
         
-        print("✓ Created performance indexes")
+        log.info("✓ Created performance indexes")
     
     async def down(self):
         """Rollback migration"""
-        print("Rolling back performance indexes...")
+        log.info("Rolling back performance indexes...")
         # In production, would drop specific indexes by name
     
     async def _create_index(self, collection: str, fields: list):
         """Create compound index"""
         field_str = ", ".join(f"{f}:{d}" for f, d in fields)
-        print(f"Creating compound index on {collection}: [{field_str}]")
+        log.info(f"Creating compound index on {collection}: [{field_str}]")
     
     async def _create_text_index(self, collection: str, fields: list):
         """Create text search index"""
-        print(f"Creating text index on {collection}: {fields}")
+        log.info(f"Creating text index on {collection}: {fields}")
+
+
+# Explicit registry entry so the runner resolves the class without
+# scanning module attributes
+MIGRATION = AddPerformanceIndexesMigration
@@ -2,7 +2,7 @@
 Migration: Add Security Fields
 """
 
-from backend.migrations.runner import Migration
+from backend.migrations.runner import Migration, log
 
 
 class AddSecurityFieldsMigration(Migration):
@@ -11,15 +11,15 @@ class AddSecurityFieldsMigration(Migration):
     async def up(self):
         """Apply migration"""
         # Add security_score to projects
-        print("Adding security_score field to projects...")
+        log.info("Adding security_score field to projects...")
         # await self.db.update_many("projects", {}, {"$set": {"security_score": 100}})
         
         # Add encrypted flag to sensitive data
-        print("Adding encryption metadata...")
+        log.info("Adding encryption metadata...")
         # await self.db.update_many("users", {}, {"$set": {"password_encrypted": True}})
         
         # Add audit trail fields
-        print("Adding audit fields...")
+        log.info("Adding audit fields...")
         # await self.db.update_many("projects", {}, {
         #     "$set": {
         #         "last_modified_by": None,
@@ -27,9 +27,14 @@ class AddSecurityFieldsMigration(Migration):
         #     }
         # })
         
-        print("✓ Added security fields")
+        log.info("✓ Added security fields")
     
     async def down(self):
         """Rollback migration"""
-        print("Removing security fields...")
+        log.info("Removing security fields...")
         # await self.db.update_many("projects", {}, {"$unset": {"security_score": ""}})
+
+
+# Explicit registry entry so the runner resolves the class without
+# scanning module attributes
+MIGRATION = AddSecurityFieldsMigration
@@ -10,9 +10,32 @@ Usage:
 
 import sys
 import asyncio
+import logging
+import logging.handlers
+import queue
 from backend.services.db import InMemoryDB
 from backend.migrations.runner import MigrationRunner
 
+# Use uvloop for asyncio.run when available (lower per-await overhead)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Migration output goes through a queue so the event loop never blocks on
+# a slow stdout (e.g. redirected to a network log sink); the listener
+# thread drains it to the terminal
+_log_queue: queue.Queue = queue.Queue(-1)
+_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout)
+)
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+
 
 async def main():
     # Initialize database
@@ -42,4 +65,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    _listener.start()
+    try:
+        asyncio.run(main())
+    finally:
+        _listener.stop()
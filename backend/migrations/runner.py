@@ -4,9 +4,14 @@ Database Migration System
 
 from typing import List, Dict, Any
 from datetime import datetime
+import logging
 import os
 import importlib.util
 
+# Handlers are configured by the CLI (migrate.py); logging keeps stdout
+# writes off the event loop when drained through a queue
+log = logging.getLogger("migrations")
+
 
 class Migration:
     """Base class for database migrations"""
@@ -32,6 +37,12 @@ class MigrationRunner:
         self.db = db
         self.migrations_dir = migrations_dir
         self.migrations_collection = "migrations"
+        # Migration classes resolved once per name; repeated up/down/status
+        # calls skip the exec_module + class scan
+        self._class_cache: Dict[str, type] = {}
+        # Discovery result keyed on the directory mtime, so the repeated
+        # walks within one command reuse a single directory read
+        self._discovery_cache = None
     
     async def get_applied_migrations(self) -> List[str]:
         """Get list of applied migrations"""
@@ -51,12 +62,25 @@ class MigrationRunner:
         """Discover all migration files"""
         if not os.path.exists(self.migrations_dir):
             return []
-        
-        migrations = []
-        for filename in sorted(os.listdir(self.migrations_dir)):
-            if filename.endswith(".py") and filename != "__init__.py" and filename != "runner.py":
-                migrations.append(filename[:-3])  # Remove .py extension
-        
+
+        # status/up call this twice per command; reuse the listing as long
+        # as the directory has not changed
+        dir_mtime = os.stat(self.migrations_dir).st_mtime_ns
+        if self._discovery_cache is not None and self._discovery_cache[0] == dir_mtime:
+            return self._discovery_cache[1]
+
+        # scandir batches the directory read into one syscall and avoids
+        # the extra stat per entry that listdir-based checks would need
+        with os.scandir(self.migrations_dir) as entries:
+            migrations = sorted(
+                entry.name[:-3]  # Remove .py extension
+                for entry in entries
+                if entry.is_file()
+                and entry.name.endswith(".py")
+                and entry.name not in ("__init__.py", "runner.py", "migrate.py")
+            )
+
+        self._discovery_cache = (dir_mtime, migrations)
         return migrations
     
     async def run_migrations(self, target: str = None):
@@ -74,35 +98,39 @@ class MigrationRunner:
                 target_idx = pending.index(target)
                 pending = pending[:target_idx + 1]
             except ValueError:
-                print(f"Target migration {target} not found")
+                log.info(f"Target migration {target} not found")
                 return
         
-        print(f"Running {len(pending)} migrations...")
-        
+        log.info(f"Running {len(pending)} migrations...")
+
+        applied_records: List[Dict[str, Any]] = []
+
         for migration_name in pending:
-            print(f"Applying {migration_name}...")
-            
+            log.info(f"Applying {migration_name}...")
+
             # Load migration module
             migration_class = self._load_migration(migration_name)
             migration = migration_class(self.db)
-            
+
             # Run migration
             try:
                 await migration.up()
-                
-                # Record migration
-                await self.db.insert(
-                    self.migrations_collection,
-                    {
-                        "name": migration_name,
-                        "applied_at": datetime.utcnow()
-                    }
-                )
-                
-                print(f"✓ {migration_name} applied successfully")
+
+                applied_records.append({
+                    "name": migration_name,
+                    "applied_at": datetime.utcnow()
+                })
+
+                log.info(f"✓ {migration_name} applied successfully")
             except Exception as e:
-                print(f"✗ {migration_name} failed: {str(e)}")
+                log.info(f"✗ {migration_name} failed: {str(e)}")
                 break
+
+        # Record all successful migrations in one ordered batch write
+        # rather than one insert round-trip per migration; on failure this
+        # still covers everything applied up to the break
+        if applied_records:
+            await self.db.insert_many(self.migrations_collection, applied_records)
     
     async def rollback(self, steps: int = 1):
         """
@@ -114,16 +142,16 @@ class MigrationRunner:
         applied = await self.get_applied_migrations()
         
         if not applied:
-            print("No migrations to rollback")
+            log.info("No migrations to rollback")
             return
         
         # Rollback last N migrations
         to_rollback = applied[-steps:]
         
-        print(f"Rolling back {len(to_rollback)} migrations...")
+        log.info(f"Rolling back {len(to_rollback)} migrations...")
         
         for migration_name in reversed(to_rollback):
-            print(f"Rolling back {migration_name}...")
+            log.info(f"Rolling back {migration_name}...")
             
             # Load migration module
             migration_class = self._load_migration(migration_name)
@@ -139,42 +167,54 @@ class MigrationRunner:
                     {"name": migration_name}
                 )
                 
-                print(f"✓ {migration_name} rolled back successfully")
+                log.info(f"✓ {migration_name} rolled back successfully")
             except Exception as e:
-                print(f"✗ {migration_name} rollback failed: {str(e)}")
+                log.info(f"✗ {migration_name} rollback failed: {str(e)}")
                 break
     
     def _load_migration(self, migration_name: str):
         """Load migration class from file"""
+        cached = self._class_cache.get(migration_name)
+        if cached is not None:
+            return cached
+
         migration_path = os.path.join(self.migrations_dir, f"{migration_name}.py")
-        
+
         spec = importlib.util.spec_from_file_location(migration_name, migration_path)
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
-        
-        # Find Migration class
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if isinstance(attr, type) and issubclass(attr, Migration) and attr != Migration:
-                return attr
-        
-        raise ValueError(f"No Migration class found in {migration_name}")
+
+        # Prefer the explicit MIGRATION registry entry; fall back to
+        # scanning module attributes for older migration files
+        migration_cls = getattr(module, "MIGRATION", None)
+        if migration_cls is None:
+            for attr_name in dir(module):
+                attr = getattr(module, attr_name)
+                if isinstance(attr, type) and issubclass(attr, Migration) and attr != Migration:
+                    migration_cls = attr
+                    break
+
+        if migration_cls is None:
+            raise ValueError(f"No Migration class found in {migration_name}")
+
+        self._class_cache[migration_name] = migration_cls
+        return migration_cls
     
     async def status(self):
         """Show migration status"""
         applied = await self.get_applied_migrations()
         pending = await self.get_pending_migrations()
         
-        print("\n=== Migration Status ===")
-        print(f"Applied: {len(applied)}")
-        print(f"Pending: {len(pending)}")
+        log.info("\n=== Migration Status ===")
+        log.info(f"Applied: {len(applied)}")
+        log.info(f"Pending: {len(pending)}")
         
         if applied:
-            print("\nApplied migrations:")
+            log.info("\nApplied migrations:")
             for m in applied:
-                print(f"  ✓ {m}")
+                log.info(f"  ✓ {m}")
         
         if pending:
-            print("\nPending migrations:")
+            log.info("\nPending migrations:")
             for m in pending:
-                print(f"  ○ {m}")
+                log.info(f"  ○ {m}")
@@ -1,7 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict
 
+# These are read-only DTOs; freezing lets pydantic skip mutation hooks and
+# makes instances hashable/shareable across requests.
 class Project(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(alias="_id")
     name: str
     source_type: str
@@ -10,6 +14,8 @@ class Project(BaseModel):
     status: str = "queued"
 
 class FileMetric(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(alias="_id")
     project_id: str
     path: str
@@ -24,6 +30,8 @@ class FileMetric(BaseModel):
     fn_count: int
 
 class CodeSmell(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(alias="_id")
     project_id: str
     path: str
@@ -34,6 +42,8 @@ class CodeSmell(BaseModel):
     end_line: int
 
 class RiskScore(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(alias="_id")
     project_id: str
     path: str
@@ -3,7 +3,9 @@ Prometheus Metrics for Application Monitoring
 """
 
 from typing import Dict, Callable
+from collections import defaultdict
 from functools import wraps
+from bisect import bisect_left
 import time
 
 
@@ -11,16 +13,28 @@ class PrometheusMetrics:
     """
     Prometheus-style metrics collector
     """
-    
+
+    # Upper bounds (ms) for histogram buckets; observations above the last
+    # bound land in the implicit +Inf bucket
+    BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
     def __init__(self):
-        self.counters: Dict[str, int] = {}
+        self.counters: Dict[str, int] = defaultdict(int)
         self.gauges: Dict[str, float] = {}
-        self.histograms: Dict[str, list] = {}
+        # Fixed-size aggregates per histogram: memory stays constant no
+        # matter how many observations arrive
+        self.histograms: Dict[str, Dict] = defaultdict(self._new_histogram)
+        # Finished keys per (name, labels) pair: the sort + join in
+        # _make_key runs once per distinct label combination
+        self._key_cache: Dict[tuple, str] = {}
     
+    @classmethod
+    def _new_histogram(cls) -> Dict:
+        return {"count": 0, "sum": 0.0, "buckets": [0] * (len(cls.BUCKETS) + 1)}
+
     def increment_counter(self, name: str, value: int = 1, labels: Dict[str, str] = None):
         """Increment a counter metric"""
-        key = self._make_key(name, labels)
-        self.counters[key] = self.counters.get(key, 0) + value
+        self.counters[self._make_key(name, labels)] += value
     
     def set_gauge(self, name: str, value: float, labels: Dict[str, str] = None):
         """Set a gauge metric"""
@@ -29,17 +43,22 @@ class PrometheusMetrics:
     
     def observe_histogram(self, name: str, value: float, labels: Dict[str, str] = None):
         """Add observation to histogram"""
-        key = self._make_key(name, labels)
-        if key not in self.histograms:
-            self.histograms[key] = []
-        self.histograms[key].append(value)
+        histogram = self.histograms[self._make_key(name, labels)]
+        histogram["count"] += 1
+        histogram["sum"] += value
+        histogram["buckets"][bisect_left(self.BUCKETS, value)] += 1
     
     def _make_key(self, name: str, labels: Dict[str, str] = None) -> str:
         """Create metric key with labels"""
         if not labels:
             return name
-        label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-        return f"{name}{{{label_str}}}"
+
+        cache_key = (name, frozenset(labels.items()))
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+            key = self._key_cache[cache_key] = f"{name}{{{label_str}}}"
+        return key
     
     def get_metrics_text(self) -> str:
         """Generate Prometheus text format"""
@@ -53,11 +72,16 @@ class PrometheusMetrics:
         for key, value in self.gauges.items():
             lines.append(f"{key} {value}")
         
-        # Histograms (simplified - just count and sum)
-        for key, values in self.histograms.items():
-            lines.append(f"{key}_count {len(values)}")
-            lines.append(f"{key}_sum {sum(values)}")
-        
+        # Histograms: cumulative buckets plus count and sum
+        for key, histogram in self.histograms.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.BUCKETS, histogram["buckets"]):
+                cumulative += bucket_count
+                lines.append(f'{key}_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f'{key}_bucket{{le="+Inf"}} {histogram["count"]}')
+            lines.append(f"{key}_count {histogram['count']}")
+            lines.append(f"{key}_sum {histogram['sum']}")
+
         return "\n".join(lines)
 
 
@@ -75,7 +99,9 @@ def track_request_duration(endpoint: str):
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            # Monotonic integer clock: immune to NTP adjustments and free
+            # of float-subtraction precision loss
+            start_time = time.perf_counter_ns()
             try:
                 result = await func(*args, **kwargs)
                 status = "success"
@@ -84,7 +110,7 @@ def track_request_duration(endpoint: str):
                 status = "error"
                 raise e
             finally:
-                duration = (time.time() - start_time) * 1000  # ms
+                duration = (time.perf_counter_ns() - start_time) / 1_000_000  # ms
                 metrics.observe_histogram(
                     "http_request_duration_ms",
                     duration,
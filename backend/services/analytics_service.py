@@ -12,6 +12,7 @@ This module processes project metrics including:
 """
 
 from .db import get_database
+import heapq
 import traceback
 
 
@@ -30,23 +31,27 @@ class AnalyticsService:
             if hasattr(db, '_connected') and not db._connected:
                 await db.connect()
             metrics = await db.get_metrics(project_id)
+            total = len(metrics)
             # Parse sort parameter - expected format: "field_name:-1" or "field_name:1"
             if sort:
                 try:
                     field, direction = sort.split(":")
-                    # Convert direction string to boolean for reverse sorting
-                    reverse = direction.strip() == "-1"
-                    # Apply sorting to metrics based on specified field
-                    metrics = sorted(metrics, key=lambda m: m.get(field, 0), reverse=reverse)
+                    key = lambda m: m.get(field, 0)
+                    # Only the top `limit` entries are returned, so a partial
+                    # selection beats sorting the whole list
+                    if direction.strip() == "-1":
+                        metrics = heapq.nlargest(limit, metrics, key=key)
+                    else:
+                        metrics = heapq.nsmallest(limit, metrics, key=key)
                 except Exception:
                     # Silently ignore invalid sort parameters
                     pass
-            
+
             # Return structured response with metrics and metadata
             return {
                 "project_id": project_id,
                 "metrics": metrics[:limit],  # Apply limit to results
-                "total": len(metrics),       # Total count before limiting
+                "total": total,              # Total count before limiting
                 "updated_at": "now"          # Timestamp for cache invalidation
             }
         except Exception as error:
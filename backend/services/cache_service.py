@@ -0,0 +1,112 @@
+"""
+Cache Service for CodeSenseX
+
+Shared cache layer for hot read endpoints (cached metrics, analytics,
+dashboards). Uses Redis when REDIS_URL is configured and the redis
+package is installed; falls back to a process-local in-memory cache
+otherwise, mirroring the in-memory/Mongo split in services/db.py.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+# Default TTL for cached analytics/metrics payloads (seconds)
+DEFAULT_TTL_SECONDS = 300
+
+
+class InMemoryCache:
+    """Process-local cache with TTL support, used when Redis is unavailable."""
+
+    def __init__(self, ttl_seconds: int = DEFAULT_TTL_SECONDS) -> None:
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.ttl = ttl_seconds
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if datetime.utcnow() > entry["expires_at"]:
+            del self._entries[key]
+            return None
+        return entry["value"]
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in cache with specified or default TTL."""
+        self._entries[key] = {
+            "value": value,
+            "expires_at": datetime.utcnow() + timedelta(seconds=ttl or self.ttl)
+        }
+
+    async def delete(self, key: str) -> None:
+        """Delete specified key from cache."""
+        self._entries.pop(key, None)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """Delete every key that starts with the given prefix."""
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+
+    async def clear(self) -> None:
+        """Clear all cache entries."""
+        self._entries.clear()
+
+
+class RedisCache:
+    """Redis-backed cache shared across workers. Values are JSON-encoded."""
+
+    def __init__(self, redis_url: str, ttl_seconds: int = DEFAULT_TTL_SECONDS) -> None:
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(redis_url, decode_responses=True)
+        self.ttl = ttl_seconds
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from Redis, decoding the stored JSON payload."""
+        raw = await self._client.get(key)
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except (ValueError, TypeError):
+            return None
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in Redis with specified or default TTL."""
+        await self._client.set(key, json.dumps(value, default=str), ex=ttl or self.ttl)
+
+    async def delete(self, key: str) -> None:
+        """Delete specified key from Redis."""
+        await self._client.delete(key)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """Delete every key that starts with the given prefix."""
+        async for key in self._client.scan_iter(match=prefix + "*"):
+            await self._client.delete(key)
+
+    async def clear(self) -> None:
+        """Flush the cache database."""
+        await self._client.flushdb()
+
+
+# Singleton cache instance
+_cache_instance = None
+
+
+def get_cache():
+    """Factory function to get the shared cache instance (singleton)."""
+    global _cache_instance
+    if _cache_instance is None:
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            try:
+                _cache_instance = RedisCache(redis_url)
+                print(f"✅ Using Redis cache")
+            except ImportError:
+                print("⚠️  redis package not installed. Run: pip install redis")
+                _cache_instance = InMemoryCache()
+        else:
+            _cache_instance = InMemoryCache()
+    return _cache_instance
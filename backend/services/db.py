@@ -5,6 +5,7 @@ Supports both in-memory storage (for development) and MongoDB Atlas (for product
 Set USE_IN_MEMORY_DB=true in .env to use in-memory database.
 """
 
+import asyncio
 import os
 from datetime import datetime
 from typing import Dict, Any, List, Optional
@@ -71,6 +72,11 @@ class DatabaseInterface(ABC):
     @abstractmethod
     async def save_scan_record(self, project_id: str, scan_data: Dict[str, Any]) -> str:
         pass
+
+    @abstractmethod
+    async def save_scan_records(self, project_id: str, scans: List[Dict[str, Any]]) -> List[str]:
+        """Save a batch of scan records in one operation."""
+        pass
     
     @abstractmethod
     async def find(self, collection: str, query: Dict[str, Any], sort: List = None, limit: int = None) -> List[Dict[str, Any]]:
@@ -81,6 +87,11 @@ class DatabaseInterface(ABC):
     async def insert(self, collection: str, document: Dict[str, Any]) -> str:
         """Generic insert method for any collection."""
         pass
+
+    @abstractmethod
+    async def insert_many(self, collection: str, documents: List[Dict[str, Any]]) -> List[str]:
+        """Insert a batch of documents in one operation."""
+        pass
     
     @abstractmethod
     async def connect(self) -> bool:
@@ -96,9 +107,12 @@ class InMemoryDB(DatabaseInterface):
     
     def __init__(self):
         self.projects: Dict[str, Dict[str, Any]] = {}
-        self.file_metrics: Dict[str, Dict[str, Any]] = {}
-        self.risks: Dict[str, Dict[str, Any]] = {}
-        self.smells: Dict[str, Dict[str, Any]] = {}
+        # Documents bucketed by project_id first: per-project reads
+        # return one bucket's values instead of filtering every
+        # project's documents
+        self.file_metrics: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.risks: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.smells: Dict[str, Dict[Any, Dict[str, Any]]] = {}
         self.scan_history: Dict[str, List[Dict[str, Any]]] = {}  # project_id -> list of scans
         self._connected = True
     
@@ -109,32 +123,32 @@ class InMemoryDB(DatabaseInterface):
         return self.projects.get(project_id)
     
     async def set_metrics(self, project_id: str, metrics: List[Dict[str, Any]]) -> None:
+        bucket = self.file_metrics.setdefault(project_id, {})
         for m in metrics:
-            key = f"{project_id}:{m.get('path', '')}"
             m['project_id'] = project_id
-            self.file_metrics[key] = m
-    
+            bucket[m.get('path', '')] = m
+
     async def get_metrics(self, project_id: str) -> List[Dict[str, Any]]:
-        return [m for m in self.file_metrics.values() if m.get('project_id') == project_id]
-    
+        return list(self.file_metrics.get(project_id, {}).values())
+
     async def set_risks(self, project_id: str, risks: List[Dict[str, Any]]) -> None:
+        bucket = self.risks.setdefault(project_id, {})
         for r in risks:
-            key = f"{project_id}:{r.get('path', '')}"
             r['project_id'] = project_id
-            self.risks[key] = r
-    
+            bucket[r.get('path', '')] = r
+
     async def get_risks(self, project_id: str) -> List[Dict[str, Any]]:
-        return [r for r in self.risks.values() if r.get('project_id') == project_id]
-    
+        return list(self.risks.get(project_id, {}).values())
+
     async def set_smells(self, project_id: str, smells: List[Dict[str, Any]]) -> None:
+        bucket = self.smells.setdefault(project_id, {})
         for s in smells:
             file_path = s.get("path", s.get("file_path", ""))
-            key = f"{project_id}:{file_path}:{s.get('type', '')}:{s.get('line', 0)}"
             s['project_id'] = project_id
-            self.smells[key] = s
-    
+            bucket[(file_path, s.get('type', ''), s.get('line', 0))] = s
+
     async def get_smells(self, project_id: str) -> List[Dict[str, Any]]:
-        return [s for s in self.smells.values() if s.get('project_id') == project_id]
+        return list(self.smells.get(project_id, {}).values())
     
     async def get_scan_history(self, project_id: str, limit: int = 30) -> List[Dict[str, Any]]:
         """Get historical scan records for a project."""
@@ -159,6 +173,10 @@ class InMemoryDB(DatabaseInterface):
         scan_data['timestamp'] = datetime.utcnow().isoformat()
         self.scan_history[project_id].append(scan_data)
         return scan_data['_id']
+
+    async def save_scan_records(self, project_id: str, scans: List[Dict[str, Any]]) -> List[str]:
+        """Save a batch of scan records to history."""
+        return [await self.save_scan_record(project_id, scan) for scan in scans]
     
     async def find(self, collection: str, query: Dict[str, Any], sort: List = None, limit: int = None) -> List[Dict[str, Any]]:
         """Generic find method for any collection."""
@@ -191,8 +209,19 @@ class InMemoryDB(DatabaseInterface):
             return results
         
         # For other collections, filter by query
+        if collection in ("file_metrics", "risks", "smells"):
+            # Bucketed storage: jump straight to the project's bucket
+            # when the query names one
+            project_id = query.get("project_id")
+            if project_id is not None:
+                candidates = storage.get(project_id, {}).values()
+            else:
+                candidates = (doc for bucket in storage.values() for doc in bucket.values())
+        else:
+            candidates = storage.values()
+
         results = []
-        for key, item in storage.items():
+        for item in candidates:
             match = True
             for q_key, q_value in query.items():
                 if item.get(q_key) != q_value:
@@ -228,17 +257,21 @@ class InMemoryDB(DatabaseInterface):
         elif collection == "projects":
             self.projects[doc_id] = document
         elif collection == "file_metrics":
-            key = f"{document.get('project_id')}:{document.get('path', '')}"
-            self.file_metrics[key] = document
+            bucket = self.file_metrics.setdefault(document.get('project_id'), {})
+            bucket[document.get('path', '')] = document
         elif collection == "risks":
-            key = f"{document.get('project_id')}:{document.get('path', '')}"
-            self.risks[key] = document
+            bucket = self.risks.setdefault(document.get('project_id'), {})
+            bucket[document.get('path', '')] = document
         elif collection == "smells":
-            key = f"{document.get('project_id')}:{document.get('path', '')}:{document.get('type', '')}:{document.get('line', 0)}"
-            self.smells[key] = document
+            bucket = self.smells.setdefault(document.get('project_id'), {})
+            bucket[(document.get('path', ''), document.get('type', ''), document.get('line', 0))] = document
         
         return doc_id
-    
+
+    async def insert_many(self, collection: str, documents: List[Dict[str, Any]]) -> List[str]:
+        """Insert a batch of documents in one operation."""
+        return [await self.insert(collection, document) for document in documents]
+
     async def connect(self) -> bool:
         print("✅ Using in-memory database")
         return True
@@ -252,6 +285,13 @@ class InMemoryDB(DatabaseInterface):
         print("🔌 In-memory database cleared")
 
 
+def _fix_id(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Stringify Mongo's ObjectId in place for JSON serialization."""
+    if '_id' in doc:
+        doc['_id'] = str(doc['_id'])
+    return doc
+
+
 class MongoDBAtlas(DatabaseInterface):
     """MongoDB Atlas database for production."""
     
@@ -259,27 +299,52 @@ class MongoDBAtlas(DatabaseInterface):
         self._client = None
         self._db = None
         self._connected = False
-    
+        # Serializes the first connect: concurrent callers racing past
+        # the fast path must not each build a client and ping the server
+        self._connect_lock = asyncio.Lock()
+
     async def connect(self) -> bool:
         """Connect to MongoDB Atlas."""
         if self._connected:
             return True
-        
+
+        async with self._connect_lock:
+            if self._connected:
+                # Another caller finished connecting while we waited
+                return True
+            return await self._connect()
+
+    async def _connect(self) -> bool:
         try:
-            from motor.motor_asyncio import AsyncIOMotorClient
-            
+            # PyMongo's native async client (4.9+) talks to the event loop
+            # directly; Motor dispatched every operation through a thread pool
+            from pymongo import AsyncMongoClient
+
             mongo_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
             db_name = os.getenv("MONGODB_DB_NAME", "codesensex")
-            max_pool = int(os.getenv("MONGO_MAX_POOL_SIZE", "10"))
-            min_pool = int(os.getenv("MONGO_MIN_POOL_SIZE", "1"))
-            
-            self._client = AsyncIOMotorClient(
+            # Pool sized for bursty aggregation endpoints: async I/O only
+            # overlaps requests if the pool admits them in parallel, and a
+            # warm minimum avoids handshakes on the first burst
+            max_pool = int(os.getenv("MONGO_MAX_POOL_SIZE", "200"))
+            min_pool = int(os.getenv("MONGO_MIN_POOL_SIZE", "20"))
+            # Recycle connections idle past this window instead of
+            # keeping burst-sized pools alive forever
+            max_idle_ms = int(os.getenv("MONGO_MAX_IDLE_MS", "300000"))
+
+            self._client = AsyncMongoClient(
                 mongo_uri,
                 maxPoolSize=max_pool,
                 minPoolSize=min_pool,
-                serverSelectionTimeoutMS=30000,
+                maxIdleTimeMS=max_idle_ms,
+                waitQueueTimeoutMS=2000,
+                serverSelectionTimeoutMS=3000,
                 connectTimeoutMS=30000,
-                socketTimeoutMS=30000
+                socketTimeoutMS=30000,
+                retryWrites=True,
+                # Wire compression shrinks large aggregation responses;
+                # zlib is always available, zstd/snappy kick in when the
+                # optional packages are installed
+                compressors="zstd,snappy,zlib"
             )
             self._db = self._client[db_name]
             
@@ -294,7 +359,7 @@ class MongoDBAtlas(DatabaseInterface):
             return True
             
         except ImportError:
-            print("⚠️  motor package not installed. Run: pip install motor")
+            print("⚠️  pymongo>=4.9 not installed. Run: pip install pymongo")
             return False
         except Exception as e:
             print(f"⚠️  MongoDB connection failed: {e}")
@@ -305,23 +370,39 @@ class MongoDBAtlas(DatabaseInterface):
         if self._db is None:
             return
         
+        from pymongo import IndexModel
+
+        # Unique indexes mirror the setter upsert filters so each upsert
+        # resolves through an index instead of a collection scan; the
+        # (project_id, scan_id) pairs cover the by-scan queries and
+        # scan_history covers the timestamp sort in get_scan_history
         indexes = {
-            "projects": [("name", 1)],
-            "file_metrics": [("project_id", 1), ("path", 1)],
-            "risks": [("project_id", 1), ("risk_score", -1)],
-            "smells": [("project_id", 1), ("type", 1)]
+            "projects": [IndexModel([("name", 1)])],
+            "file_metrics": [
+                IndexModel([("project_id", 1), ("path", 1)], unique=True),
+                IndexModel([("project_id", 1), ("scan_id", 1)]),
+            ],
+            "risks": [
+                IndexModel([("project_id", 1), ("path", 1)], unique=True),
+                IndexModel([("project_id", 1), ("risk_score", -1)]),
+            ],
+            "smells": [
+                IndexModel([("project_id", 1), ("path", 1), ("type", 1), ("line", 1)], unique=True),
+                IndexModel([("project_id", 1), ("scan_id", 1)]),
+            ],
+            "scan_history": [IndexModel([("project_id", 1), ("timestamp", -1)])],
         }
-        
-        for collection, keys in indexes.items():
+
+        for collection, models in indexes.items():
             try:
-                await self._db[collection].create_index(keys)
+                await self._db[collection].create_indexes(models)
             except Exception as e:
                 print(f"Warning: Could not create index on {collection}: {e}")
     
     async def close(self) -> None:
         """Close MongoDB connection."""
         if self._client:
-            self._client.close()
+            await self._client.close()
             self._client = None
             self._db = None
             self._connected = False
@@ -341,119 +422,129 @@ class MongoDBAtlas(DatabaseInterface):
             await self.connect()
         return await self._db.projects.find_one({"_id": project_id})
     
+    # Stay well under Mongo's per-batch limits (16MB / 100k ops)
+    _BULK_BATCH_SIZE = 1000
+
+    async def _bulk_upsert(self, collection, ops) -> None:
+        """Send upsert ops in unordered batches, one round-trip each."""
+        for start in range(0, len(ops), self._BULK_BATCH_SIZE):
+            await collection.bulk_write(ops[start:start + self._BULK_BATCH_SIZE], ordered=False)
+
     async def set_metrics(self, project_id: str, metrics: List[Dict[str, Any]]) -> None:
+        if not metrics:
+            return
         if not self._connected:
             await self.connect()
-        
+        from pymongo import UpdateOne
+
+        # One bulk_write per batch instead of one round-trip per document
+        ops = []
         for m in metrics:
             m['project_id'] = project_id
-            await self._db.file_metrics.update_one(
+            ops.append(UpdateOne(
                 {"project_id": project_id, "path": m.get("path", "")},
                 {"$set": m},
                 upsert=True
-            )
+            ))
+        await self._bulk_upsert(self._db.file_metrics, ops)
     
     async def get_metrics(self, project_id: str) -> List[Dict[str, Any]]:
         if not self._connected:
             await self.connect()
-        cursor = self._db.file_metrics.find({"project_id": project_id})
-        results = await cursor.to_list(length=1000)
-        # Convert ObjectId to string for JSON serialization
-        for r in results:
-            if '_id' in r:
-                r['_id'] = str(r['_id'])
-        return results
+        # Stream the cursor in server-side batches: no 1000-doc
+        # truncation and no full-result memory spike from to_list
+        cursor = self._db.file_metrics.find({"project_id": project_id}).batch_size(500)
+        return [_fix_id(doc) async for doc in cursor]
     
     async def set_risks(self, project_id: str, risks: List[Dict[str, Any]]) -> None:
+        if not risks:
+            return
         if not self._connected:
             await self.connect()
-        
+        from pymongo import UpdateOne
+
+        ops = []
         for r in risks:
             r['project_id'] = project_id
-            await self._db.risks.update_one(
+            ops.append(UpdateOne(
                 {"project_id": project_id, "path": r.get("path", "")},
                 {"$set": r},
                 upsert=True
-            )
+            ))
+        await self._bulk_upsert(self._db.risks, ops)
     
     async def get_risks(self, project_id: str) -> List[Dict[str, Any]]:
         if not self._connected:
             await self.connect()
-        cursor = self._db.risks.find({"project_id": project_id}).sort("risk_score", -1)
-        results = await cursor.to_list(length=1000)
-        # Convert ObjectId to string for JSON serialization
-        for r in results:
-            if '_id' in r:
-                r['_id'] = str(r['_id'])
-        return results
+        cursor = self._db.risks.find({"project_id": project_id}).sort("risk_score", -1).batch_size(500)
+        return [_fix_id(doc) async for doc in cursor]
     
     async def set_smells(self, project_id: str, smells: List[Dict[str, Any]]) -> None:
+        if not smells:
+            return
         if not self._connected:
             await self.connect()
-        
+        from pymongo import UpdateOne
+
+        ops = []
         for s in smells:
             s['project_id'] = project_id
             file_path = s.get("path", s.get("file_path", ""))
-            await self._db.smells.update_one(
+            ops.append(UpdateOne(
                 {"project_id": project_id, "path": file_path, "type": s.get("type", ""), "line": s.get("line", 0)},
                 {"$set": s},
                 upsert=True
-            )
+            ))
+        await self._bulk_upsert(self._db.smells, ops)
     
     async def get_smells(self, project_id: str) -> List[Dict[str, Any]]:
         if not self._connected:
             await self.connect()
-        cursor = self._db.smells.find({"project_id": project_id})
-        results = await cursor.to_list(length=1000)
-        # Convert ObjectId to string for JSON serialization
-        for r in results:
-            if '_id' in r:
-                r['_id'] = str(r['_id'])
-        return results
+        cursor = self._db.smells.find({"project_id": project_id}).batch_size(500)
+        return [_fix_id(doc) async for doc in cursor]
     
     async def get_scan_history(self, project_id: str, limit: int = 30) -> List[Dict[str, Any]]:
         """Get historical scan records for a project."""
         if not self._connected:
             await self.connect()
         cursor = self._db.scan_history.find({"project_id": project_id}).sort("timestamp", -1).limit(limit)
-        results = await cursor.to_list(length=limit)
-        for r in results:
-            if '_id' in r:
-                r['_id'] = str(r['_id'])
-        return results
+        return [_fix_id(doc) async for doc in cursor]
     
     async def get_metrics_by_scan(self, project_id: str, scan_id: str) -> Optional[List[Dict[str, Any]]]:
         """Get metrics for a specific scan."""
         if not self._connected:
             await self.connect()
-        cursor = self._db.file_metrics.find({"project_id": project_id, "scan_id": scan_id})
-        results = await cursor.to_list(length=1000)
-        for r in results:
-            if '_id' in r:
-                r['_id'] = str(r['_id'])
+        cursor = self._db.file_metrics.find({"project_id": project_id, "scan_id": scan_id}).batch_size(500)
+        results = [_fix_id(doc) async for doc in cursor]
         return results if results else None
     
     async def get_smells_by_scan(self, project_id: str, scan_id: str) -> Optional[List[Dict[str, Any]]]:
         """Get issues for a specific scan."""
         if not self._connected:
             await self.connect()
-        cursor = self._db.smells.find({"project_id": project_id, "scan_id": scan_id})
-        results = await cursor.to_list(length=1000)
-        for r in results:
-            if '_id' in r:
-                r['_id'] = str(r['_id'])
+        cursor = self._db.smells.find({"project_id": project_id, "scan_id": scan_id}).batch_size(500)
+        results = [_fix_id(doc) async for doc in cursor]
         return results if results else None
     
     async def save_scan_record(self, project_id: str, scan_data: Dict[str, Any]) -> str:
         """Save a scan record to history."""
+        ids = await self.save_scan_records(project_id, [scan_data])
+        return ids[0]
+
+    async def save_scan_records(self, project_id: str, scans: List[Dict[str, Any]]) -> List[str]:
+        """Save a batch of scan records in one unordered insert_many."""
+        if not scans:
+            return []
         if not self._connected:
             await self.connect()
-        
-        scan_data['project_id'] = project_id
-        scan_data['timestamp'] = datetime.utcnow()
-        
-        result = await self._db.scan_history.insert_one(scan_data)
-        return str(result.inserted_id)
+
+        timestamp = datetime.utcnow()
+        for scan in scans:
+            scan['project_id'] = project_id
+            scan['timestamp'] = timestamp
+
+        result = await self._db.scan_history.insert_many(scans, ordered=False)
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
     
     async def find(self, collection: str, query: Dict[str, Any], sort: List = None, limit: int = None) -> List[Dict[str, Any]]:
         """Generic find method for any collection."""
@@ -469,15 +560,8 @@ class MongoDBAtlas(DatabaseInterface):
         # Apply limit if provided
         if limit:
             cursor = cursor.limit(limit)
-        
-        results = await cursor.to_list(length=limit if limit else 1000)
-        
-        # Convert ObjectId to string for JSON serialization
-        for r in results:
-            if '_id' in r:
-                r['_id'] = str(r['_id'])
-        
-        return results
+
+        return [_fix_id(doc) async for doc in cursor.batch_size(500)]
     
     async def insert(self, collection: str, document: Dict[str, Any]) -> str:
         """Generic insert method for any collection."""
@@ -487,6 +571,16 @@ class MongoDBAtlas(DatabaseInterface):
         result = await self._db[collection].insert_one(document)
         return str(result.inserted_id)
 
+    async def insert_many(self, collection: str, documents: List[Dict[str, Any]]) -> List[str]:
+        """Insert a batch of documents in one round-trip (ordered)."""
+        if not documents:
+            return []
+        if not self._connected:
+            await self.connect()
+
+        result = await self._db[collection].insert_many(documents)
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
+
 
 # Singleton database instance
 _db_instance: Optional[DatabaseInterface] = None
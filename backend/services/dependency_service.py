@@ -4,10 +4,25 @@ Dependency Graph Service - Analyzes file imports and generates dependency graph
 
 import os
 import ast
+import hashlib
 import re
+import subprocess
 from pathlib import Path
 from typing import Dict, List, Any
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+
+# Directories never worth traversing when analyzing or fingerprinting
+IGNORE_DIRS = {'node_modules', 'venv', '.venv', '__pycache__', '.git', 'dist', 'build'}
+
+# File extensions the analyzer understands
+SOURCE_SUFFIXES = {'.py', '.js', '.jsx', '.ts', '.tsx'}
+
+# One compiled alternation covering all three JS/TS import shapes
+# (import ... from '...', bare import '...', require('...')) so each
+# file is scanned once instead of three times
+JS_IMPORT_RE = re.compile(
+    r'(?:import\s+(?:.*?\s+from\s+)?|require\s*\(\s*)[\'"]([^\'"]+)[\'"]'
+)
 
 
 class DependencyAnalyzer:
@@ -20,18 +35,8 @@ class DependencyAnalyzer:
         
     def analyze(self) -> Dict[str, Any]:
         """Analyze all files and return dependency graph data."""
-        python_files = list(self.repo_path.rglob("*.py"))
-        js_files = list(self.repo_path.rglob("*.js"))
-        jsx_files = list(self.repo_path.rglob("*.jsx"))
-        ts_files = list(self.repo_path.rglob("*.ts"))
-        tsx_files = list(self.repo_path.rglob("*.tsx"))
-        
-        all_files = python_files + js_files + jsx_files + ts_files + tsx_files
-        
-        # Define directories to ignore during analysis
-        ignore_dirs = {'node_modules', 'venv', '.venv', '__pycache__', '.git', 'dist', 'build'}
-        all_files = [f for f in all_files if not any(d in f.parts for d in ignore_dirs)]
-        
+        all_files = list(self._iter_source_files())
+
         file_index = self._build_file_index(all_files)
         
         for file_path in all_files:
@@ -50,6 +55,19 @@ class DependencyAnalyzer:
             }
         }
     
+    def _iter_source_files(self):
+        """Yield every source file under the repo in a single traversal.
+
+        Pruning ignored directories in place keeps os.walk from ever
+        descending into them, instead of filtering their contents after
+        walking the whole tree five times with rglob.
+        """
+        for dirpath, dirnames, filenames in os.walk(self.repo_path):
+            dirnames[:] = [d for d in dirnames if d not in IGNORE_DIRS]
+            for filename in filenames:
+                if os.path.splitext(filename)[1].lower() in SOURCE_SUFFIXES:
+                    yield Path(dirpath) / filename
+
     def _build_file_index(self, files: List[Path]) -> Dict[str, Path]:
         """
         Build an index mapping file names and paths to their full Path objects.
@@ -87,23 +105,26 @@ class DependencyAnalyzer:
             rel_path = str(file_path)
         
         ext = file_path.suffix.lower()
+        if ext not in SOURCE_SUFFIXES:
+            return
+
+        # Single read shared by line counting and import extraction,
+        # instead of opening the same file once per concern
+        try:
+            content = file_path.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            content = ''
+        loc = content.count('\n') + 1 if content else 0
+
         if ext == '.py':
             file_type = 'python'
-            imports = self._get_python_imports(file_path)
+            imports = self._get_python_imports(content)
         elif ext in ['.js', '.jsx']:
             file_type = 'javascript'
-            imports = self._get_js_imports(file_path)
-        elif ext in ['.ts', '.tsx']:
-            file_type = 'typescript'
-            imports = self._get_js_imports(file_path)
+            imports = self._get_js_imports(content)
         else:
-            return
-        
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            loc = len(content.splitlines())
-        except:
-            loc = 0
+            file_type = 'typescript'
+            imports = self._get_js_imports(content)
         
         node_id = rel_path.replace('\\', '/')
         self.nodes.append({
@@ -125,10 +146,9 @@ class DependencyAnalyzer:
                     target_rel = str(resolved).replace('\\', '/')
                 self.links.append({"source": node_id, "target": target_rel, "type": "import"})
     
-    def _get_python_imports(self, file_path: Path) -> List[str]:
+    def _get_python_imports(self, content: str) -> List[str]:
         imports = []
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
             tree = ast.parse(content)
             for node in ast.walk(tree):
                 if isinstance(node, ast.Import):
@@ -141,16 +161,8 @@ class DependencyAnalyzer:
             pass
         return imports
     
-    def _get_js_imports(self, file_path: Path) -> List[str]:
-        imports = []
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            imports.extend(re.findall(r'import\s+.*?\s+from\s+[\'"]([^\'"]+)[\'"]', content))
-            imports.extend(re.findall(r'import\s+[\'"]([^\'"]+)[\'"]', content))
-            imports.extend(re.findall(r'require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)', content))
-        except:
-            pass
-        return imports
+    def _get_js_imports(self, content: str) -> List[str]:
+        return JS_IMPORT_RE.findall(content)
     
     def _resolve_import(self, import_name: str, source_file: Path, file_index: Dict[str, Path]) -> Path:
         external = ('react', 'vue', 'angular', 'express', 'lodash', 'axios', 'moment',
@@ -190,28 +202,66 @@ class DependencyAnalyzer:
         return dict(stats)
 
 
-_dependency_cache: Dict[str, Dict] = {}
+def _repo_fingerprint(repo_path: str) -> str:
+    """Cheap content fingerprint of a repository for cache invalidation.
+
+    Prefers the git HEAD commit; falls back to hashing the
+    (path, mtime, size) tuples of every file so non-git checkouts still
+    invalidate when their contents change.
+    """
+    try:
+        proc = subprocess.run(
+            ["git", "-C", repo_path, "rev-parse", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+        )
+        if proc.returncode == 0:
+            return proc.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+    digest = hashlib.blake2b(digest_size=16)
+    for dirpath, dirnames, filenames in os.walk(repo_path):
+        dirnames[:] = [d for d in dirnames if d not in IGNORE_DIRS]
+        for filename in sorted(filenames):
+            try:
+                stat = os.stat(os.path.join(dirpath, filename))
+            except OSError:
+                continue
+            digest.update(f"{dirpath}/{filename}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()
+
+
+# Graphs keyed by (project_id, repo fingerprint): a changed repo gets a
+# fresh analysis instead of a stale hit, and the LRU cap keeps graphs
+# for abandoned projects from accumulating
+_dependency_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+_DEPENDENCY_CACHE_MAX = 32
 
 
 async def get_dependency_graph(project_id: str) -> Dict[str, Any]:
     """Get dependency graph for a project."""
     from services.db import db
-    
-    if project_id in _dependency_cache:
-        return _dependency_cache[project_id]
-    
+
     project = await db.get_project(project_id)
     if not project:
         return {"nodes": [], "links": [], "error": "Project not found"}
-    
+
     repo_path = project.get("local_path")
     if not repo_path or not os.path.exists(repo_path):
         return {"nodes": [], "links": [], "message": "Repository not available locally."}
-    
+
+    cache_key = (project_id, _repo_fingerprint(repo_path))
+    cached = _dependency_cache.get(cache_key)
+    if cached is not None:
+        _dependency_cache.move_to_end(cache_key)
+        return cached
+
     try:
         analyzer = DependencyAnalyzer(repo_path)
         result = analyzer.analyze()
-        _dependency_cache[project_id] = result
+        _dependency_cache[cache_key] = result
+        if len(_dependency_cache) > _DEPENDENCY_CACHE_MAX:
+            _dependency_cache.popitem(last=False)
         return result
     except Exception as e:
         return {"nodes": [], "links": [], "error": str(e)}
@@ -2,6 +2,7 @@
 Historical Trends Service - Tracks scan history in MongoDB for comparisons and timeline analysis.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 
@@ -57,10 +58,12 @@ async def get_trend_data(project_id: str, days: int = 30, limit: int = 50) -> Di
     """Get historical trend data for a project."""
     from services.db import db
     
-    # Get current metrics and smells
-    metrics = await db.get_metrics(project_id)
-    smells = await db.get_smells(project_id)
-    risks = await db.get_risks(project_id)
+    # Get current metrics, smells and risks in one batch of round-trips
+    metrics, smells, risks = await asyncio.gather(
+        db.get_metrics(project_id),
+        db.get_smells(project_id),
+        db.get_risks(project_id),
+    )
     
     if not metrics:
         return {
@@ -143,32 +146,37 @@ async def get_trend_data(project_id: str, days: int = 30, limit: int = 50) -> Di
     }
 
 
-async def get_comparison_data(project_id: str) -> Dict[str, Any]:
-    """Compare current state with previous scan."""
-    history = await get_scan_history(project_id, limit=2)
-    
+def _isoformat(timestamp) -> Any:
+    """Render a timestamp as ISO string, passing through pre-formatted values."""
+    if timestamp is None:
+        return None
+    return timestamp if isinstance(timestamp, str) else timestamp.isoformat()
+
+
+def _build_comparison(history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the current-vs-previous comparison payload from scan records."""
     if len(history) < 2:
         return {
             "has_comparison": False,
             "message": "Not enough scans for comparison. Run more analyses."
         }
-    
+
     current = history[0]  # Most recent
     previous = history[1]  # Previous scan
-    
+
     curr_metrics = current.get("metrics", {})
     prev_metrics = previous.get("metrics", {})
-    
+
     return {
         "has_comparison": True,
         "current": {
             "scan_id": current.get("scan_id"),
-            "timestamp": current.get("timestamp").isoformat() if current.get("timestamp") else None,
+            "timestamp": _isoformat(current.get("timestamp")),
             "metrics": curr_metrics
         },
         "previous": {
             "scan_id": previous.get("scan_id"),
-            "timestamp": previous.get("timestamp").isoformat() if previous.get("timestamp") else None,
+            "timestamp": _isoformat(previous.get("timestamp")),
             "metrics": prev_metrics
         },
         "diff": {
@@ -185,3 +193,30 @@ async def get_comparison_data(project_id: str) -> Dict[str, Any]:
             "avg_risk": ((curr_metrics.get("avg_risk", 0) - prev_metrics.get("avg_risk", 1)) / max(prev_metrics.get("avg_risk", 1), 1)) * 100
         }
     }
+
+
+async def get_comparison_data(project_id: str) -> Dict[str, Any]:
+    """Compare current state with previous scan."""
+    history = await get_scan_history(project_id, limit=2)
+    return _build_comparison(history)
+
+
+async def get_history_bundle(project_id: str, include: tuple, limit: int = 50) -> Dict[str, Any]:
+    """
+    Fetch several history facets (scans, trends, compare) in one call.
+
+    Frontends request scans, trends and comparison together on page load;
+    serving them from a single underlying trend computation avoids three
+    separate history reads (and three snapshot writes).
+    """
+    trends = await get_trend_data(project_id, limit=limit)
+    scans = trends.get("scans", [])
+
+    bundle: Dict[str, Any] = {"project_id": project_id}
+    if "scans" in include:
+        bundle["scans"] = scans
+    if "trends" in include:
+        bundle["trends"] = trends
+    if "compare" in include:
+        bundle["compare"] = _build_comparison(scans)
+    return bundle
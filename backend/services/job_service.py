@@ -2,6 +2,7 @@ from datetime import datetime
 import sys
 from typing import Dict, Any
 from .db import get_database
+from .performance_service import invalidate_project_caches
 from .repo_analyzer import repo_analyzer
 
 
@@ -47,7 +48,11 @@ class JobService:
         await db.set_metrics(project_id, metrics)
         await db.set_risks(project_id, risks)
         await db.set_smells(project_id, smells)
-        
+
+        # Fresh results are in the database; drop cached payloads built
+        # from the previous scan so read endpoints serve the new data
+        await invalidate_project_caches(project_id)
+
         print(f"✅ Analysis complete: {len(metrics)} files, {len(smells)} smells, {len(risks)} risk scores", flush=True)
         
         return {
@@ -60,14 +60,15 @@ class NotificationService:
                     data: Dict, severity: str = "info"):
         """Send notification to all subscribers"""
         notifications_sent = []
-        
+        channel_sends = []
+
         for key, subscriber in self.subscribers.items():
             if subscriber["project_id"] != project_id:
                 continue
-                
+
             if notification_type not in subscriber["notification_types"]:
                 continue
-            
+
             notification = {
                 "id": f"notification_{int(datetime.utcnow().timestamp())}",
                 "project_id": project_id,
@@ -77,13 +78,20 @@ class NotificationService:
                 "timestamp": datetime.utcnow().isoformat(),
                 "read": False
             }
-            
-            for channel in subscriber["channels"]:
-                await self._send_to_channel(channel, notification, subscriber["user_id"])
-                
+
+            channel_sends.extend(
+                self._send_to_channel(channel, notification, subscriber["user_id"])
+                for channel in subscriber["channels"]
+            )
+
             notifications_sent.append(notification)
             self.notification_history.append(notification)
-        
+
+        # Dispatch all channel sends in one batch instead of awaiting each
+        # subscriber/channel pair serially
+        if channel_sends:
+            await asyncio.gather(*channel_sends)
+
         return {
             "notifications_sent": len(notifications_sent),
             "details": notifications_sent
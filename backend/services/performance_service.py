@@ -5,8 +5,23 @@ Implements caching, incremental scans, and batch operations
 
 from typing import Dict, List, Optional, Set
 from datetime import datetime, timedelta
+import asyncio
 import hashlib
 
+from services.cache_service import get_cache
+
+# Prefer xxhash for change-detection hashing when installed; fall back to
+# blake2b from the stdlib. Neither needs cryptographic strength here - the
+# hash only detects whether a file changed between scans.
+try:
+    import xxhash
+
+    def _content_hash(data: bytes) -> str:
+        return xxhash.xxh3_64_hexdigest(data)
+except ImportError:
+    def _content_hash(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 
 class CacheService:
     """In-memory cache with TTL support."""
@@ -47,12 +62,42 @@ class CacheService:
         self.cache.clear()
 
 
+async def invalidate_project_caches(project_id: str) -> None:
+    """Purge every shared-cache entry derived from a project's scan data.
+
+    Called when a scan stores fresh results and from the explicit
+    invalidate endpoint, so cached read endpoints pick up new data
+    immediately instead of serving stale payloads until the TTL lapses.
+    """
+    cache = get_cache()
+    for key in (
+        f"metrics_{project_id}",
+        f"risks_{project_id}",
+        f"smells_{project_id}",
+        f"scan_{project_id}",
+    ):
+        await cache.delete(key)
+
+    # These key families carry trailing variants (_{days} windows,
+    # _{limit}_{include} facets), so they are purged by prefix
+    for prefix in (
+        f"analytics_productivity_{project_id}_",
+        f"analytics_savings_{project_id}_",
+        f"analytics_heatmap_{project_id}",
+        f"response_history_{project_id}_",
+        f"response_trends_{project_id}",
+        f"response_dependencies_{project_id}",
+    ):
+        await cache.delete_prefix(prefix)
+
+
 class PerformanceService:
     """Manages performance optimizations"""
     
     def __init__(self, db):
         self.db = db
         self.cache = CacheService(ttl_seconds=1800)  # 30 minutes
+        self.shared_cache = get_cache()  # Redis when configured, in-memory otherwise
         self.file_hashes = {}
     
     async def incremental_scan(self, project_id: str, files: List[str]) -> Dict:
@@ -85,65 +130,70 @@ class PerformanceService:
         }
     
     async def _calculate_file_hash(self, file_path: str) -> str:
-        """Calculate SHA256 hash of file content"""
+        """Calculate content hash of a file for change detection"""
         try:
             with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+                return _content_hash(f.read())
         except:
             return ""
     
     async def get_metrics_cached(self, project_id: str) -> Dict:
         """Get metrics with caching"""
         cache_key = f"metrics_{project_id}"
-        cached = self.cache.get(cache_key)
-        
+        cached = await self.shared_cache.get(cache_key)
+
         if cached:
             cached["from_cache"] = True
             return cached
-        
+
         # Fetch from database
         metrics = await self.db.get_metrics(project_id)
-        self.cache.set(cache_key, metrics)
-        metrics["from_cache"] = False
-        
-        return metrics
-    
+        result = {
+            "project_id": project_id,
+            "metrics": metrics,
+            "from_cache": False
+        }
+        await self.shared_cache.set(cache_key, result)
+
+        return result
+
     async def invalidate_cache(self, project_id: str):
         """Invalidate all cache entries for a project"""
-        keys_to_delete = [
+        for key in (
             f"metrics_{project_id}",
             f"risks_{project_id}",
             f"smells_{project_id}",
-            f"scan_{project_id}"
-        ]
-        
-        for key in keys_to_delete:
+            f"scan_{project_id}",
+        ):
             self.cache.delete(key)
+        await invalidate_project_caches(project_id)
     
     async def batch_scan_projects(self, project_ids: List[str]) -> Dict:
-        """Scan multiple projects in batch"""
-        results = []
-        
-        for project_id in project_ids:
-            try:
-                # This would trigger actual scan
-                result = {
-                    "project_id": project_id,
-                    "status": "queued",
-                    "estimated_time": "5 minutes"
-                }
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "project_id": project_id,
-                    "status": "error",
-                    "error": str(e)
-                })
-        
+        """Scan multiple projects in batch, queueing them concurrently."""
+        results = await asyncio.gather(
+            *(self._queue_project_scan(project_id) for project_id in project_ids)
+        )
+
         return {
             "total_projects": len(project_ids),
-            "results": results
+            "results": list(results)
         }
+
+    async def _queue_project_scan(self, project_id: str) -> Dict:
+        """Queue a scan for a single project."""
+        try:
+            # This would trigger actual scan
+            return {
+                "project_id": project_id,
+                "status": "queued",
+                "estimated_time": "5 minutes"
+            }
+        except Exception as e:
+            return {
+                "project_id": project_id,
+                "status": "error",
+                "error": str(e)
+            }
     
     async def optimize_database_queries(self, project_id: str) -> Dict:
         """Optimize database queries for faster dashboard loads"""
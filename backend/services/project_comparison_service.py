@@ -2,6 +2,8 @@
 Project Comparison Service - Compare metrics, quality, and issues between two projects.
 """
 
+import asyncio
+
 from typing import Dict, List, Any
 from datetime import datetime
 from services.db import get_database
@@ -20,27 +22,27 @@ class ProjectComparisonService:
         db = get_database()
         
         # Get project info
-        project_a = await db.get_project(project_a_id)
-        project_b = await db.get_project(project_b_id)
-        
+        project_a, project_b = await asyncio.gather(
+            db.get_project(project_a_id),
+            db.get_project(project_b_id)
+        )
+
         if not project_a or not project_b:
             return {
                 "error": "One or both projects not found",
                 "project_a_found": bool(project_a),
                 "project_b_found": bool(project_b)
             }
-        
-        # Get metrics for both projects
-        metrics_a = await db.get_metrics(project_a_id)
-        metrics_b = await db.get_metrics(project_b_id)
-        
-        # Get risks for both projects
-        risks_a = await db.get_risks(project_a_id)
-        risks_b = await db.get_risks(project_b_id)
-        
-        # Get smells for both projects
-        smells_a = await db.get_smells(project_a_id)
-        smells_b = await db.get_smells(project_b_id)
+
+        # Get metrics, risks and smells for both projects concurrently
+        metrics_a, metrics_b, risks_a, risks_b, smells_a, smells_b = await asyncio.gather(
+            db.get_metrics(project_a_id),
+            db.get_metrics(project_b_id),
+            db.get_risks(project_a_id),
+            db.get_risks(project_b_id),
+            db.get_smells(project_a_id),
+            db.get_smells(project_b_id)
+        )
         
         # Calculate summary statistics
         summary_a = ProjectComparisonService._calculate_summary(metrics_a, risks_a, smells_a)
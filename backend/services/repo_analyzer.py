@@ -77,7 +77,7 @@ MEMORY_PATTERNS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class FileMetrics:
     path: str
     loc: int
@@ -92,7 +92,7 @@ class FileMetrics:
     language: str
 
 
-@dataclass 
+@dataclass(slots=True)
 class CodeSmell:
     path: str
     type: str
@@ -102,7 +102,7 @@ class CodeSmell:
     suggestion: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskScore:
     path: str
     risk_score: int  # 0-100
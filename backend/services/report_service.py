@@ -1,3 +1,5 @@
+import asyncio
+
 from services.db import get_database
 from datetime import datetime
 
@@ -11,11 +13,14 @@ class ReportService:
         # Get database instance
         db = get_database()
         
-        # Gather data using async methods
-        project = await db.get_project(project_id) or {}
-        metrics_list = await db.get_metrics(project_id)
-        risks_list = await db.get_risks(project_id)
-        smells_list = await db.get_smells(project_id)
+        # Gather data concurrently - the four fetches are independent
+        project, metrics_list, risks_list, smells_list = await asyncio.gather(
+            db.get_project(project_id),
+            db.get_metrics(project_id),
+            db.get_risks(project_id),
+            db.get_smells(project_id),
+        )
+        project = project or {}
         
         # Calculate summary stats
         total_files = len(metrics_list)
@@ -15,6 +15,8 @@ Features:
 
 from typing import List, Dict, Optional, Any, Union
 from datetime import datetime
+from functools import lru_cache
+import asyncio
 import re
 
 # Search scoring constants
@@ -24,6 +26,36 @@ FILETYPE_MATCH_SCORE = 5
 ISSUE_MATCH_SCORE = 3
 
 
+@lru_cache(maxsize=128)
+def _compile_search_pattern(pattern: str) -> re.Pattern:
+    """Compile a user-supplied search regex, caching across requests."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _scan_files_for_pattern(files: List[Dict], pattern: str,
+                            pattern_re: Optional[re.Pattern]) -> List[Dict]:
+    """Scan code smells for a pattern; regex mode when pattern_re is given."""
+    pattern_lower = pattern.lower()
+    matching_files = []
+
+    for file in files:
+        # Check in code smells
+        for smell in file.get('code_smells', []):
+            code_snippet = smell.get('code_snippet', '')
+            message = smell.get('message', '')
+
+            if pattern_re is not None:
+                if pattern_re.search(code_snippet) or pattern_re.search(message):
+                    matching_files.append(file)
+                    break
+            else:
+                if pattern_lower in code_snippet.lower() or pattern_lower in message.lower():
+                    matching_files.append(file)
+                    break
+
+    return matching_files
+
+
 class SearchFilter:
     """
     Represents a search filter configuration for saved searches.
@@ -124,73 +156,76 @@ class SearchService:
         return matching_files
     
     def _apply_filters(self, files: List[Dict], filters: Dict) -> List[Dict]:
-        """Apply custom filters to file list"""
-        filtered = files
-        
+        """Apply custom filters to file list in a single fused pass."""
+        predicates = self._build_filter_predicates(filters)
+
+        if not predicates:
+            return files
+
+        # One pass over the files instead of materializing an intermediate
+        # list per active filter condition
+        return [f for f in files if all(pred(f) for pred in predicates)]
+
+    def _build_filter_predicates(self, filters: Dict) -> List:
+        """Compile active filter conditions into a list of predicates."""
+        predicates = []
+
         # Severity filter
         if 'severity' in filters:
             severity_levels = filters['severity']
             if not isinstance(severity_levels, list):
                 severity_levels = [severity_levels]
-            filtered = [
-                f for f in filtered
-                if self._get_severity(f) in severity_levels
-            ]
-        
+            severity_set = frozenset(severity_levels)
+            predicates.append(lambda f: self._get_severity(f) in severity_set)
+
         # Risk score filter
         if 'min_risk_score' in filters:
             minimum_risk_score = filters['min_risk_score']
-            filtered = [
-                file_item for file_item in filtered
-                if file_item.get('risk_score', 0) >= minimum_risk_score
-            ]
-        
+            predicates.append(lambda f: f.get('risk_score', 0) >= minimum_risk_score)
+
         if 'max_risk_score' in filters:
             maximum_risk_score = filters['max_risk_score']
-            filtered = [
-                file_item for file_item in filtered
-                if file_item.get('risk_score', 0) <= maximum_risk_score
-            ]
-        
+            predicates.append(lambda f: f.get('risk_score', 0) <= maximum_risk_score)
+
         # Complexity filter
         if 'min_complexity' in filters:
             min_complexity = filters['min_complexity']
-            filtered = [
-                f for f in filtered
-                if f.get('complexity', 0) >= min_complexity
-            ]
-        
+            predicates.append(lambda f: f.get('complexity', 0) >= min_complexity)
+
         # Duplication filter
         if 'has_duplication' in filters:
             has_dup = filters['has_duplication']
-            filtered = [
-                f for f in filtered
-                if (f.get('duplication_percentage', 0) > 0) == has_dup
-            ]
-        
+            predicates.append(lambda f: (f.get('duplication_percentage', 0) > 0) == has_dup)
+
         # File type filter
         if 'file_types' in filters:
             types = filters['file_types']
             if not isinstance(types, list):
                 types = [types]
-            filtered = [
-                f for f in filtered
-                if f.get('type') in types
-            ]
-        
+            type_set = frozenset(types)
+            predicates.append(lambda f: f.get('type') in type_set)
+
         # Date range filter
-        if 'date_from' in filters or 'date_to' in filters:
-            filtered = self._filter_by_date(filtered, filters)
-        
+        date_from = filters.get('date_from')
+        date_to = filters.get('date_to')
+        if date_from or date_to:
+            def in_date_range(f):
+                file_date = f.get('scanned_at', f.get('created_at'))
+                if not file_date:
+                    return False
+                if date_from and file_date < date_from:
+                    return False
+                if date_to and file_date > date_to:
+                    return False
+                return True
+            predicates.append(in_date_range)
+
         # Issue count filter
         if 'min_issues' in filters:
             min_issues = filters['min_issues']
-            filtered = [
-                f for f in filtered
-                if len(f.get('issues', [])) >= min_issues
-            ]
-        
-        return filtered
+            predicates.append(lambda f: len(f.get('issues', [])) >= min_issues)
+
+        return predicates
     
     def _get_severity(self, file_data: Dict) -> str:
         """Determine file severity based on risk score and threshold analysis."""
@@ -204,26 +239,6 @@ class SearchService:
         else:
             return 'low'
     
-    def _filter_by_date(self, files: List[Dict], filters: Dict) -> List[Dict]:
-        """Filter files by date range"""
-        date_from = filters.get('date_from')
-        date_to = filters.get('date_to')
-        
-        filtered = []
-        for file in files:
-            file_date = file.get('scanned_at', file.get('created_at'))
-            if not file_date:
-                continue
-            
-            if date_from and file_date < date_from:
-                continue
-            if date_to and file_date > date_to:
-                continue
-            
-            filtered.append(file)
-        
-        return filtered
-    
     def _sort_by_relevance(self, files: List[Dict], query: str) -> List[Dict]:
         """Sort files by relevance score"""
         return sorted(files, key=lambda f: f.get('relevance_score', 0), reverse=True)
@@ -280,39 +295,30 @@ class SearchService:
                                      pattern: str, regex: bool = False) -> List[Dict]:
         """Search for code patterns using regex"""
         files = await self.db.get_files_by_project(project_id)
-        
+
         if regex:
             try:
-                pattern_re = re.compile(pattern, re.IGNORECASE)
+                pattern_re = _compile_search_pattern(pattern)
             except re.error:
                 raise ValueError("Invalid regex pattern")
-        
-        matching_files = []
-        for file in files:
-            # Check in code smells
-            for smell in file.get('code_smells', []):
-                code_snippet = smell.get('code_snippet', '')
-                message = smell.get('message', '')
-                
-                if regex:
-                    if pattern_re.search(code_snippet) or pattern_re.search(message):
-                        matching_files.append(file)
-                        break
-                else:
-                    if pattern.lower() in code_snippet.lower() or pattern.lower() in message.lower():
-                        matching_files.append(file)
-                        break
-        
-        return matching_files
+        else:
+            pattern_re = None
+
+        # The matching loop is pure CPU work over every smell in the project;
+        # run it off the event loop so concurrent requests are not stalled.
+        return await asyncio.to_thread(_scan_files_for_pattern, files, pattern, pattern_re)
     
     async def multi_file_comparison_search(self, project_id: str, 
                                           file_paths: List[str]) -> Dict:
         """Compare multiple files side by side"""
         files = await self.db.get_files_by_project(project_id)
-        
+
+        # Index files by path once instead of scanning the list per requested path
+        files_by_path = {f.get('path'): f for f in files}
+
         compared_files = {}
         for path in file_paths:
-            matching_file = next((f for f in files if f.get('path') == path), None)
+            matching_file = files_by_path.get(path)
             if matching_file:
                 compared_files[path] = {
                     "risk_score": matching_file.get('risk_score', 0),
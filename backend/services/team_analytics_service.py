@@ -3,18 +3,47 @@ Team Analytics and Dashboard Service
 Enhanced team productivity metrics, cost savings, and leaderboards
 """
 
-from typing import Dict, List
+from typing import Awaitable, Callable, Dict, List
 from datetime import datetime, timedelta
+import asyncio
+
+from services.cache_service import get_cache
 
 
 class TeamAnalyticsService:
     """Advanced team analytics and performance tracking"""
-    
+
     def __init__(self, db):
         self.db = db
-    
+        self.cache = get_cache()  # Redis when configured, in-memory otherwise
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def _singleflight(self, key: str, compute: Callable[[], Awaitable[Dict]]) -> Dict:
+        """Deduplicate concurrent identical computations.
+
+        If a computation for `key` is already running, await its result
+        instead of starting a second one - a burst of dashboard requests
+        then costs one DB round-trip rather than one per caller.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
     async def get_team_productivity(self, project_id: str, days: int = 30) -> Dict:
         """Calculate team productivity metrics"""
+        cache_key = f"analytics_productivity_{project_id}_{days}"
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        return await self._singleflight(
+            cache_key, lambda: self._compute_team_productivity(cache_key, project_id, days)
+        )
+
+    async def _compute_team_productivity(self, cache_key: str, project_id: str, days: int) -> Dict:
         scans = await self.db.get_scan_history(project_id, limit=days)
         
         if len(scans) < 2:
@@ -43,7 +72,7 @@ class TeamAnalyticsService:
                 elif latest_issues > first_issues:
                     files_degraded += 1
         
-        return {
+        result = {
             "time_period_days": days,
             "files_improved": files_improved,
             "files_degraded": files_degraded,
@@ -51,9 +80,21 @@ class TeamAnalyticsService:
             "net_quality_change": files_improved - files_degraded,
             "improvement_rate": (files_improved / len(latest_scan.get('files', [])) * 100) if latest_scan.get('files') else 0
         }
+        await self.cache.set(cache_key, result)
+        return result
     
     async def calculate_cost_savings(self, project_id: str, days: int = 30) -> Dict:
         """Calculate cost savings from bug prevention"""
+        cache_key = f"analytics_savings_{project_id}_{days}"
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        return await self._singleflight(
+            cache_key, lambda: self._compute_cost_savings(cache_key, project_id, days)
+        )
+
+    async def _compute_cost_savings(self, cache_key: str, project_id: str, days: int) -> Dict:
         productivity = await self.get_team_productivity(project_id, days)
         
         # Industry averages
@@ -76,7 +117,7 @@ class TeamAnalyticsService:
         
         hours_saved = critical_bugs * 40 + high_bugs * 16 + medium_bugs * 4
         
-        return {
+        result = {
             "time_period_days": days,
             "total_cost_savings": total_savings,
             "breakdown": {
@@ -87,9 +128,21 @@ class TeamAnalyticsService:
             "developer_hours_saved": hours_saved,
             "hourly_cost_savings": hours_saved * DEV_HOUR_COST
         }
+        await self.cache.set(cache_key, result)
+        return result
     
     async def get_technology_heatmap(self, project_id: str) -> Dict:
         """Analyze which technologies/languages are riskiest"""
+        cache_key = f"analytics_heatmap_{project_id}"
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        return await self._singleflight(
+            cache_key, lambda: self._compute_technology_heatmap(cache_key, project_id)
+        )
+
+    async def _compute_technology_heatmap(self, cache_key: str, project_id: str) -> Dict:
         files = await self.db.get_files_by_project(project_id)
         
         tech_stats = {}
@@ -122,7 +175,9 @@ class TeamAnalyticsService:
             reverse=True
         )
         
-        return {
+        result = {
             "technologies": dict(sorted_tech),
             "riskiest_technology": sorted_tech[0][0] if sorted_tech else "none"
         }
+        await self.cache.set(cache_key, result)
+        return result
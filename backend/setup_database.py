@@ -10,7 +10,7 @@ Requirements: MongoDB connection string in environment variables
 
 import asyncio
 import os
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -23,7 +23,7 @@ async def setup_database():
     """Create collections and indexes in MongoDB Atlas"""
     
     print(f"🔌 Connecting to MongoDB Atlas...")
-    client = AsyncIOMotorClient(MONGODB_URI)
+    client = AsyncMongoClient(MONGODB_URI)
     db = client[DATABASE_NAME]
     
     try:
@@ -171,7 +171,7 @@ async def setup_database():
         print(f"\n❌ Error setting up database: {e}")
         raise
     finally:
-        client.close()
+        await client.close()
         print("🔌 Connection closed")
 
 